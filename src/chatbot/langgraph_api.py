@@ -4,9 +4,12 @@ LangGraph-based FastAPI Application
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+from pathlib import Path
 import logging
 
 from src.workflows.graph import create_property_workflow
@@ -15,6 +18,7 @@ from src.models.schemas import ChatRequest, ChatResponse
 from src.services.chat_history import ChatHistoryService
 from src.services.search_session import SearchSessionService
 from src.workflows.booking_flow import booking_flow_manager
+from src.workflows.nodes.property_search import search_fingerprint
 from src.tools.calendar_tool import CalendarTool
 from src.tools.sms_tool import SMSTool
 from config.settings import settings
@@ -36,6 +40,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Static assets for the visualization frontend
+VISUALIZATION_STATIC_DIR = Path(__file__).resolve().parent.parent / "visualization" / "static"
+app.mount(
+    "/visualization/static",
+    StaticFiles(directory=str(VISUALIZATION_STATIC_DIR)),
+    name="visualization-static"
+)
+
 workflow = create_property_workflow()
 chat_history = ChatHistoryService()
 search_session = SearchSessionService()
@@ -51,13 +65,75 @@ async def health_check():
 @app.get("/visualization/workflow")
 async def get_workflow_structure():
     """Get complete workflow structure and execution data"""
+    workflow_visualizer.note_poll()
     return workflow_visualizer.get_workflow_structure()
 
 @app.get("/visualization/live")
 async def get_live_execution_data():
     """Get real-time execution data for live visualization updates"""
+    workflow_visualizer.note_poll()
     return workflow_visualizer.get_current_execution_data()
 
+@app.get("/visualization/stream")
+async def stream_execution_updates():
+    """Push node-status deltas as Server-Sent Events"""
+    async def event_stream():
+        import asyncio
+        import json
+
+        # Enum-to-string mapping resolved once per stream; `.value` goes
+        # through a descriptor on every access otherwise
+        status_values = {s: s.value for s in NodeStatus}
+
+        last_version = -1
+        last_execution_id = None
+        last_statuses: Dict[str, str] = {}
+        last_execution_status = None
+
+        workflow_visualizer.sse_subscribers += 1
+        try:
+            while True:
+                version = workflow_visualizer.state_version
+                if version != last_version:
+                    last_version = version
+                    execution = workflow_visualizer.current_execution
+                    if execution:
+                        if execution.id != last_execution_id:
+                            last_execution_id = execution.id
+                            last_statuses = {}
+                            last_execution_status = None
+                        for node in execution.nodes:
+                            status = status_values.get(node.status, node.status)
+                            if last_statuses.get(node.node_id) != status:
+                                last_statuses[node.node_id] = status
+                                payload = json.dumps({
+                                    "execution_id": execution.id,
+                                    "id": node.node_id,
+                                    "status": status
+                                })
+                                yield f"event: node-status\ndata: {payload}\n\n"
+                        # Node deltas carry statuses only; when the run itself
+                        # finishes, tell the client so it resyncs once and
+                        # picks up node payloads, durations and final status
+                        if execution.status != last_execution_status:
+                            last_execution_status = execution.status
+                            if execution.status != "running":
+                                payload = json.dumps({
+                                    "execution_id": execution.id,
+                                    "status": execution.status
+                                })
+                                yield f"event: execution-status\ndata: {payload}\n\n"
+                await asyncio.sleep(0.1)
+        finally:
+            workflow_visualizer.sse_subscribers -= 1
+
+    from fastapi.responses import StreamingResponse
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @app.post("/visualization/clear")
 async def clear_executions():
     """Clear all execution history"""
@@ -81,8 +157,11 @@ async def get_all_executions():
 @app.get("/visualization", response_class=HTMLResponse)
 async def visualization_frontend():
     """Serve the integrated visualization frontend"""
-    from src.visualization.frontend import VISUALIZATION_HTML
-    return HTMLResponse(content=VISUALIZATION_HTML)
+    return FileResponse(
+        VISUALIZATION_STATIC_DIR / "index.html",
+        media_type="text/html",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
@@ -112,6 +191,7 @@ async def chat_endpoint(request: ChatRequest):
             "confidence": None,
             "properties": [],
             "search_filters": prior_filters or {},
+            "_last_search_fp": None,
             "search_query": None,
             "queries": [],
             "reflection_notes": None,
@@ -139,12 +219,34 @@ async def chat_endpoint(request: ChatRequest):
             "missing_fields": [],
             "info_prompt": None
         }
-        
+
+        # When this turn repeats the last completed search's inputs, seed the
+        # stored fingerprint and results so search_properties can skip the
+        # extraction -> search pipeline
+        last_search = search_session.get_last_search(request.user_id)
+        if last_search and last_search.get("fp") == search_fingerprint(request.query, prior_filters):
+            initial_state["_last_search_fp"] = last_search["fp"]
+            initial_state["properties"] = last_search.get("properties") or []
+
         booking_updates = None
         if request.action_type in ['inquire', 'book_schedule', 'select_slot', 'provide_info', 'cancel_booking']:
+            # Validation progress lives server-side in the session; it is never
+            # taken from the request, which would let a client skip validation
+            initial_state["validated_fields"] = tuple(
+                search_session.get_validated_fields(request.user_id))
             booking_updates = await booking_flow_manager.process_user_action(initial_state)
             initial_state.update(booking_updates)
-            
+
+            try:
+                if request.user_id:
+                    if booking_updates.get("workflow_complete") or request.action_type == 'cancel_booking':
+                        search_session.set_validated_fields(request.user_id, [])
+                    elif "validated_fields" in booking_updates:
+                        search_session.set_validated_fields(
+                            request.user_id, booking_updates["validated_fields"])
+            except Exception:
+                pass
+
             # Track booking flow
             await workflow_visualizer.track_node_execution(
                 "booking_flow", 
@@ -307,10 +409,16 @@ Notes:
             chat_history.append_message(request.user_id, "user", request.query)
             chat_history.append_message(request.user_id, "assistant", response_message)
 
-        # Persist updated filters from final state
+        # Persist updated filters and the completed search from final state
         try:
             if request.user_id:
                 search_session.set_filters(request.user_id, final_state.get("search_filters") or {})
+                if final_state.get("_last_search_fp"):
+                    search_session.set_last_search(
+                        request.user_id,
+                        final_state["_last_search_fp"],
+                        final_state.get("properties") or []
+                    )
         except Exception:
             pass
 
@@ -9,6 +9,13 @@ import logging
 import sys
 import os
 
+# The slotted dataclasses in src/visualization need dataclass(slots=True);
+# fail with a clear message instead of an import-time TypeError deep in the
+# node chain when run on an older interpreter
+if sys.version_info < (3, 10):
+    sys.exit("PropertyTek requires Python 3.10+ (dataclass slots support); "
+             f"running {sys.version.split()[0]}")
+
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -1,9 +1,10 @@
 """
 Search Session Service
-Persists per-user property search filters across chat turns using Redis.
+Persists per-user property search filters and booking validation progress
+across chat turns using Redis.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 import json
 import redis
 from config.settings import settings
@@ -42,4 +43,52 @@ class SearchSessionService:
         to_store = json.dumps(filters or {})
         self.client.set(self._key(user_id), to_store)
 
+    def _last_search_key(self, user_id: str) -> str:
+        return f"search:last:{user_id}"
+
+    def get_last_search(self, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Fingerprint and results of the user's last completed search, or
+        None when nothing usable is stored"""
+        if not user_id:
+            return None
+        raw = self.client.get(self._last_search_key(user_id))
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+            if isinstance(data, dict) and data.get("fp"):
+                return data
+            return None
+        except Exception:
+            return None
+
+    def set_last_search(self, user_id: Optional[str], fp: Optional[str],
+                        properties: Optional[List[Dict[str, Any]]]) -> None:
+        if not user_id or not fp:
+            return
+        self.client.set(self._last_search_key(user_id),
+                        json.dumps({"fp": fp, "properties": properties or []}))
+
+    def _validated_key(self, user_id: str) -> str:
+        return f"booking:validated:{user_id}"
+
+    def get_validated_fields(self, user_id: Optional[str]) -> List[str]:
+        if not user_id:
+            return []
+        raw = self.client.get(self._validated_key(user_id))
+        if not raw:
+            return []
+        try:
+            data = json.loads(raw)
+            if isinstance(data, list):
+                return [f for f in data if isinstance(f, str)]
+            return []
+        except Exception:
+            return []
+
+    def set_validated_fields(self, user_id: Optional[str], fields: Optional[Iterable[str]]) -> None:
+        if not user_id:
+            return
+        self.client.set(self._validated_key(user_id), json.dumps(list(fields or [])))
+
 
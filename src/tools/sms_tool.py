@@ -1,12 +1,63 @@
+import re
+
+import httpx
 from twilio.rest import Client
+from twilio.http import HttpClient
+from twilio.http.response import Response
 from typing import List, Dict, Any, Optional
 from config.settings import settings
 import asyncio
 
+
+class _HttpxTwilioHttpClient(HttpClient):
+    """Async Twilio HTTP client that multiplexes requests over a shared HTTP/2 connection"""
+
+    is_async = True
+
+    def __init__(self, client: httpx.AsyncClient):
+        self._client = client
+
+    async def request(self, method, url, params=None, data=None, headers=None,
+                      auth=None, timeout=None, allow_redirects=False) -> Response:
+        response = await self._client.request(
+            method,
+            url,
+            params=params,
+            data=data,
+            headers=headers,
+            auth=auth,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            follow_redirects=allow_redirects
+        )
+        return Response(int(response.status_code), response.text, dict(response.headers))
+
+
+# Shared across all SMSTool instances so every Twilio request reuses one
+# multiplexed HTTP/2 connection instead of paying per-request TLS/TCP setup
+_NON_DIGITS = re.compile(r'\D+')
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=10.0
+        )
+    return _shared_http_client
+
+
 class SMSTool:
     def __init__(self):
         if settings.TWILIO_ACCOUNT_SID and settings.TWILIO_AUTH_TOKEN:
-            self.client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+            self.client = Client(
+                settings.TWILIO_ACCOUNT_SID,
+                settings.TWILIO_AUTH_TOKEN,
+                http_client=_HttpxTwilioHttpClient(_get_shared_http_client())
+            )
             self.from_number = settings.TWILIO_PHONE_NUMBER
         else:
             self.client = None
@@ -38,7 +89,7 @@ class SMSTool:
                     "message": "Cannot send SMS to the same number as the sender"
                 }
             
-            message_obj = self.client.messages.create(
+            message_obj = await self.client.messages.create_async(
                 body=message,
                 from_=self.from_number,
                 to=formatted_number
@@ -139,25 +190,26 @@ Interested? Reply YES to schedule a tour or visit our website.
                 "message": "SMS service not configured"
             }
         
+        # Pipeline all sends concurrently over the shared HTTP/2 connection
+        send_results = await asyncio.gather(
+            *(self.send_sms(phone_number, message) for phone_number in recipients)
+        )
+
         results = []
         successful = 0
         failed = 0
-        
-        for phone_number in recipients:
-            result = await self.send_sms(phone_number, message)
+
+        for phone_number, result in zip(recipients, send_results):
             results.append({
                 "phone_number": phone_number,
                 "result": result
             })
-            
+
             if result["success"]:
                 successful += 1
             else:
                 failed += 1
-            
-            # Add small delay to avoid rate limiting
-            await asyncio.sleep(0.1)
-        
+
         return {
             "success": True,
             "total_sent": len(recipients),
@@ -251,23 +303,40 @@ Interested? Reply YES to schedule a tour or visit our website.
     
     def validate_phone_number(self, phone_number: str) -> bool:
         """Validate phone number format"""
+        # Reject on cheap syntactic checks before the more expensive formatting
+        if not phone_number:
+            return False
+
+        s = phone_number.strip()
+        if not s or len(s) > 20:
+            return False
+
+        raw = _NON_DIGITS.sub('', s)
+        # Must be between 7 and 15 digits (E.164 standard)
+        if not (7 <= len(raw) <= 15):
+            return False
+
         try:
-            formatted = self.format_phone_number(phone_number)
-            
+            formatted = self.format_phone_number(s)
+
             # Basic E.164 validation
             if not formatted.startswith('+'):
                 return False
-            
+
             digits = formatted[1:]  # Remove + sign
-            
-            # Must be all digits after +
-            if not digits.isdigit():
+
+            # Must be all digits after + (byte-level scan beats str.isdigit's
+            # Unicode category walk)
+            try:
+                if digits.encode('ascii').translate(None, b'0123456789') != b'':
+                    return False
+            except UnicodeEncodeError:
                 return False
-            
+
             # Must be between 7 and 15 digits (E.164 standard)
             if len(digits) < 7 or len(digits) > 15:
                 return False
-            
+
             # Don't allow test numbers or obviously fake numbers
             fake_patterns = [
                 '1234567890', '0000000000', '1111111111', '2222222222',
@@ -2,7 +2,7 @@
 Data models for workflow visualization
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -24,7 +24,7 @@ class NodeType(Enum):
     PARALLEL = "parallel"
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeExecution:
     """Represents a single node execution"""
     node_id: str
@@ -44,7 +44,7 @@ class NodeExecution:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowExecution:
     """Represents a complete workflow execution"""
     execution_id: str
@@ -67,62 +67,63 @@ class WorkflowExecution:
         return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeDefinition:
     """Defines a node in the workflow graph"""
     id: str
     label: str
     description: str
     node_type: NodeType
-    position: Dict[str, float]  # x, y coordinates
-    dependencies: List[str]  # List of node IDs this depends on
-    expected_inputs: List[str]  # Expected input fields
-    expected_outputs: List[str]  # Expected output fields
+    position: Tuple[float, float]  # x, y coordinates
+    dependencies: Tuple[str, ...]  # Node IDs this depends on
+    expected_inputs: Tuple[str, ...]  # Expected input fields
+    expected_outputs: Tuple[str, ...]  # Expected output fields
     is_conditional: bool = False
     parallel_group: Optional[str] = None
 
 
-# Complete workflow node definitions
-WORKFLOW_NODES = [
+# Complete workflow node definitions. A tuple so accidental mutation cannot
+# silently invalidate the lookup indexes built below.
+WORKFLOW_NODES = (
     NodeDefinition(
         id="start",
         label="Start",
         description="Entry point for user queries",
         node_type=NodeType.START,
-        position={"x": 100, "y": 300},
-        dependencies=[],
-        expected_inputs=["user_query", "user_id"],
-        expected_outputs=["user_query", "user_id"]
+        position=(100, 300),
+        dependencies=(),
+        expected_inputs=("user_query", "user_id"),
+        expected_outputs=("user_query", "user_id")
     ),
     NodeDefinition(
         id="analyze_intent",
         label="Intent\nAnalyzer",
         description="Analyzes user intent and extracts entities",
         node_type=NodeType.PROCESSOR,
-        position={"x": 250, "y": 300},
-        dependencies=["start"],
-        expected_inputs=["user_query"],
-        expected_outputs=["intent", "entities", "confidence"]
+        position=(250, 300),
+        dependencies=("start",),
+        expected_inputs=("user_query",),
+        expected_outputs=("intent", "entities", "confidence")
     ),
     NodeDefinition(
         id="search_properties",
         label="Property\nSearch",
         description="Searches for properties based on criteria",
         node_type=NodeType.PROCESSOR,
-        position={"x": 400, "y": 200},
-        dependencies=["analyze_intent"],
-        expected_inputs=["search_filters", "search_query"],
-        expected_outputs=["properties", "search_results"]
+        position=(400, 200),
+        dependencies=("analyze_intent",),
+        expected_inputs=("search_filters", "search_query"),
+        expected_outputs=("properties", "search_results")
     ),
     NodeDefinition(
         id="reflect",
         label="Reflection\nEngine",
         description="Reflects on search results and decides next steps",
         node_type=NodeType.DECISION,
-        position={"x": 550, "y": 200},
-        dependencies=["search_properties"],
-        expected_inputs=["properties", "search_query"],
-        expected_outputs=["reflection_notes", "next_step", "needs_more_research"],
+        position=(550, 200),
+        dependencies=("search_properties",),
+        expected_inputs=("properties", "search_query"),
+        expected_outputs=("reflection_notes", "next_step", "needs_more_research"),
         is_conditional=True
     ),
     NodeDefinition(
@@ -130,30 +131,30 @@ WORKFLOW_NODES = [
         label="Available\nSlots",
         description="Retrieves available appointment slots",
         node_type=NodeType.PROCESSOR,
-        position={"x": 400, "y": 400},
-        dependencies=["analyze_intent"],
-        expected_inputs=["property_id", "date_preferences"],
-        expected_outputs=["available_slots", "slot_count"]
+        position=(400, 400),
+        dependencies=("analyze_intent",),
+        expected_inputs=("property_id", "date_preferences"),
+        expected_outputs=("available_slots", "slot_count")
     ),
     NodeDefinition(
         id="collect_user_info",
         label="User Info\nCollection",
         description="Collects required user information for booking",
         node_type=NodeType.PROCESSOR,
-        position={"x": 550, "y": 400},
-        dependencies=["get_available_slots"],
-        expected_inputs=["required_fields"],
-        expected_outputs=["user_name", "user_email", "user_phone", "user_pets"]
+        position=(550, 400),
+        dependencies=("get_available_slots",),
+        expected_inputs=("required_fields",),
+        expected_outputs=("user_name", "user_email", "user_phone", "user_pets")
     ),
     NodeDefinition(
         id="create_calendar_event",
         label="Calendar\nManager",
         description="Creates Google Calendar event for appointment",
         node_type=NodeType.PROCESSOR,
-        position={"x": 700, "y": 350},
-        dependencies=["collect_user_info"],
-        expected_inputs=["appointment_details", "user_info"],
-        expected_outputs=["calendar_event_id", "event_link"],
+        position=(700, 350),
+        dependencies=("collect_user_info",),
+        expected_inputs=("appointment_details", "user_info"),
+        expected_outputs=("calendar_event_id", "event_link"),
         parallel_group="booking_actions"
     ),
     NodeDefinition(
@@ -161,10 +162,10 @@ WORKFLOW_NODES = [
         label="SMS\nSender",
         description="Sends SMS confirmation to user",
         node_type=NodeType.PROCESSOR,
-        position={"x": 700, "y": 450},
-        dependencies=["create_calendar_event"],
-        expected_inputs=["phone_number", "appointment_details"],
-        expected_outputs=["sms_sent", "sms_result"],
+        position=(700, 450),
+        dependencies=("create_calendar_event",),
+        expected_inputs=("phone_number", "appointment_details"),
+        expected_outputs=("sms_sent", "sms_result"),
         parallel_group="booking_actions"
     ),
     NodeDefinition(
@@ -172,37 +173,54 @@ WORKFLOW_NODES = [
         label="Response\nGenerator",
         description="Generates final response for user",
         node_type=NodeType.PROCESSOR,
-        position={"x": 850, "y": 300},
-        dependencies=["reflect", "send_sms_confirmation"],
-        expected_inputs=["final_state", "context"],
-        expected_outputs=["response_message", "suggested_actions"]
+        position=(850, 300),
+        dependencies=("reflect", "send_sms_confirmation"),
+        expected_inputs=("final_state", "context"),
+        expected_outputs=("response_message", "suggested_actions")
     ),
     NodeDefinition(
         id="end",
         label="End",
         description="Workflow completion",
         node_type=NodeType.END,
-        position={"x": 1000, "y": 300},
-        dependencies=["generate_response"],
-        expected_inputs=["response_message"],
-        expected_outputs=[]
+        position=(1000, 300),
+        dependencies=("generate_response",),
+        expected_inputs=("response_message",),
+        expected_outputs=()
     )
-]
+)
+
+
+# Lookup indexes built once at import time; the workflow graph is static,
+# so the accessors below never need to rescan WORKFLOW_NODES
+_NODE_BY_ID: Dict[str, NodeDefinition] = {node.id: node for node in WORKFLOW_NODES}
+
+_DEPENDENTS: Dict[str, List[NodeDefinition]] = {}
+for _node in WORKFLOW_NODES:
+    for _dep in _node.dependencies:
+        _DEPENDENTS.setdefault(_dep, []).append(_node)
+
+_PARALLEL_GROUPS: Dict[str, List[NodeDefinition]] = {}
+for _node in WORKFLOW_NODES:
+    if _node.parallel_group:
+        _PARALLEL_GROUPS.setdefault(_node.parallel_group, []).append(_node)
+
+del _node, _dep
 
 
 def get_node_by_id(node_id: str) -> Optional[NodeDefinition]:
     """Get node definition by ID"""
-    return next((node for node in WORKFLOW_NODES if node.id == node_id), None)
+    return _NODE_BY_ID.get(node_id)
 
 
 def get_dependent_nodes(node_id: str) -> List[NodeDefinition]:
     """Get all nodes that depend on the given node"""
-    return [node for node in WORKFLOW_NODES if node_id in node.dependencies]
+    return _DEPENDENTS.get(node_id, [])
 
 
 def get_parallel_nodes(node_id: str) -> List[NodeDefinition]:
     """Get all nodes in the same parallel group"""
-    node = get_node_by_id(node_id)
+    node = _NODE_BY_ID.get(node_id)
     if not node or not node.parallel_group:
         return []
-    return [n for n in WORKFLOW_NODES if n.parallel_group == node.parallel_group]
+    return _PARALLEL_GROUPS.get(node.parallel_group, [])
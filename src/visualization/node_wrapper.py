@@ -2,79 +2,103 @@
 LangGraph Node Wrapper for Real-time Visualization Tracking
 """
 
-import asyncio
 import functools
+import time
 from typing import Dict, Any, Callable
 from src.visualization.workflow_visualizer import workflow_visualizer, NodeStatus
 
+# Known user-info keys, fixed at module scope so the wrapper does a handful of
+# dict lookups instead of scanning every state key with startswith per call
+_USER_KEYS = ("user_name", "user_email", "user_phone", "user_pets", "user_id")
+
+# Output fields copied straight through when present; keys absent from the
+# result are skipped instead of being reported as empty placeholders
+_OUT_KEYS = ("intent", "confidence", "next_step", "workflow_complete",
+             "calendar_event_id", "sms_sent", "needs_more_research",
+             "entities", "search_filters")
+
+# Pre-bound status members: skips an Enum class-attribute lookup per call
+_RUNNING = NodeStatus.RUNNING
+_COMPLETED = NodeStatus.COMPLETED
+_ERROR = NodeStatus.ERROR
+
 def track_node_execution(node_id: str):
     """Decorator to track LangGraph node execution in real-time with live data flow"""
     def decorator(func: Callable):
         @functools.wraps(func)
         async def wrapper(self, state: Dict[str, Any], config=None):
+            # No viewer attached: skip input capture and both tracking awaits
+            if not workflow_visualizer.has_subscribers:
+                return await func(self, state, config)
+
             # Track node start with detailed input data
+            started = time.perf_counter()
             input_data = {
                 "user_query": state.get("user_query", ""),
                 "intent": state.get("intent", ""),
-                "properties_count": len(state.get("properties", [])),
+                "properties_count": len(state.get("properties") or ()),
                 "current_step": state.get("current_step", ""),
-                "user_info": {k: v for k, v in state.items() if k.startswith("user_") and k != "user_query"},
+                "user_info": {k: state[k] for k in _USER_KEYS if k in state},
                 "reflection_loops": state.get("reflection_loops", 0),
-                "available_slots_count": len(state.get("available_slots", [])),
+                "available_slots_count": len(state.get("available_slots") or ()),
                 "workflow_complete": state.get("workflow_complete", False),
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": started
             }
-            
+
             # Start tracking with live updates
             await workflow_visualizer.track_node_execution(
-                node_id, 
-                NodeStatus.RUNNING, 
+                node_id,
+                _RUNNING,
                 input_data
             )
-            
+
             try:
                 # Execute the actual node function
                 result = await func(self, state, config)
-                
-                # Track successful completion with comprehensive output data
+
+                # Track successful completion; only materialize output fields
+                # the node actually produced
                 output_data = {}
                 if isinstance(result, dict):
-                    output_data = {
-                        "intent": result.get("intent", ""),
-                        "confidence": result.get("confidence", 0),
-                        "properties_found": len(result.get("properties", [])),
-                        "response_message": result.get("response_message", "")[:200] if result.get("response_message") else "",
-                        "next_step": result.get("next_step", ""),
-                        "workflow_complete": result.get("workflow_complete", False),
-                        "available_slots": len(result.get("available_slots", [])),
-                        "calendar_event_id": result.get("calendar_event_id", ""),
-                        "sms_sent": result.get("sms_sent", False),
-                        "reflection_notes": result.get("reflection_notes", "")[:100] if result.get("reflection_notes") else "",
-                        "needs_more_research": result.get("needs_more_research", False),
-                        "entities": result.get("entities", {}),
-                        "search_filters": result.get("search_filters", {}),
-                        "execution_time": asyncio.get_event_loop().time() - input_data["timestamp"]
-                    }
-                
+                    for key in _OUT_KEYS:
+                        value = result.get(key)
+                        if value is not None:
+                            output_data[key] = value
+
+                    properties = result.get("properties")
+                    if properties is not None:
+                        output_data["properties_found"] = len(properties)
+                    slots = result.get("available_slots")
+                    if slots is not None:
+                        output_data["available_slots"] = len(slots)
+                    response_message = result.get("response_message")
+                    if response_message:
+                        output_data["response_message"] = response_message[:200]
+                    reflection_notes = result.get("reflection_notes")
+                    if reflection_notes:
+                        output_data["reflection_notes"] = reflection_notes[:100]
+
+                    output_data["execution_time"] = time.perf_counter() - started
+
                 await workflow_visualizer.track_node_execution(
                     node_id,
-                    NodeStatus.COMPLETED,
+                    _COMPLETED,
                     input_data,
                     output_data
                 )
-                
+
                 return result
-                
+
             except Exception as e:
                 # Track error with detailed error information
                 await workflow_visualizer.track_node_execution(
                     node_id,
-                    NodeStatus.ERROR,
+                    _ERROR,
                     input_data,
                     {"error_type": type(e).__name__, "error_details": str(e)[:200]},
                     str(e)
                 )
                 raise
-                
+
         return wrapper
     return decorator
@@ -3,8 +3,10 @@ Integrated Workflow Visualizer - Direct LangGraph Integration
 """
 
 import asyncio
+import itertools
 import json
 import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict
@@ -17,7 +19,7 @@ class NodeStatus(Enum):
     ERROR = "error"
     SKIPPED = "skipped"
 
-@dataclass
+@dataclass(slots=True)
 class NodeExecution:
     node_id: str
     status: NodeStatus
@@ -27,8 +29,13 @@ class NodeExecution:
     duration_ms: Optional[int] = None
     error_message: Optional[str] = None
 
-@dataclass
-class WorkflowExecution:
+class _ExecutionIndex:
+    # Extra slot for the nodes_by_id index: kept out of the dataclass fields
+    # so asdict still serializes only the ordered nodes list
+    __slots__ = ("nodes_by_id",)
+
+@dataclass(slots=True)
+class WorkflowExecution(_ExecutionIndex):
     id: str
     user_query: str
     user_id: str
@@ -41,6 +48,119 @@ class WorkflowExecution:
     def __post_init__(self):
         if self.nodes is None:
             self.nodes = []
+        self.nodes_by_id: Dict[str, NodeExecution] = {
+            node.node_id: node for node in self.nodes
+        }
+
+# Complete workflow structure, shared across instances: read-only reference
+# data that every visualizer uses as-is
+WORKFLOW_NODES = {
+    "analyze_intent": {
+        "label": "Intent Analyzer",
+        "type": "processor",
+        "dependencies": [],
+        "expected_inputs": ["user_query", "user_id"],
+        "expected_outputs": ["intent", "entities", "confidence"]
+    },
+    "search_properties": {
+        "label": "Property Search", 
+        "type": "processor",
+        "dependencies": ["analyze_intent"],
+        "expected_inputs": ["intent", "search_criteria"],
+        "expected_outputs": ["properties", "search_results"]
+    },
+    "reflect": {
+        "label": "Reflection Engine",
+        "type": "decision",
+        "dependencies": ["search_properties"],
+        "expected_inputs": ["properties", "search_results"],
+        "expected_outputs": ["next_step", "reflection_summary"]
+    },
+    "get_available_slots": {
+        "label": "Available Slots",
+        "type": "processor", 
+        "dependencies": ["analyze_intent"],
+        "expected_inputs": ["property_id", "date_range"],
+        "expected_outputs": ["available_slots", "slot_count"]
+    },
+    "collect_user_info": {
+        "label": "User Info Collection",
+        "type": "processor",
+        "dependencies": ["get_available_slots"],
+        "expected_inputs": ["required_fields", "current_info"],
+        "expected_outputs": ["user_info", "missing_fields", "validation_status"]
+    },
+    "create_calendar_event": {
+        "label": "Calendar Manager",
+        "type": "processor",
+        "dependencies": ["collect_user_info"],
+        "expected_inputs": ["appointment_details", "user_info"],
+        "expected_outputs": ["calendar_event_id", "event_status"]
+    },
+    "send_sms_confirmation": {
+        "label": "SMS Sender",
+        "type": "processor",
+        "dependencies": ["create_calendar_event"],
+        "expected_inputs": ["phone_number", "appointment_details"],
+        "expected_outputs": ["sms_sent", "sms_status"]
+    },
+    "generate_response": {
+        "label": "Response Generator",
+        "type": "processor",
+        "dependencies": ["reflect", "send_sms_confirmation"],
+        "expected_inputs": ["workflow_state", "results"],
+        "expected_outputs": ["response_message", "suggested_actions"]
+    }
+}
+
+# Workflow connections
+WORKFLOW_CONNECTIONS = [
+    {"source": "analyze_intent", "target": "search_properties", "type": "conditional"},
+    {"source": "analyze_intent", "target": "get_available_slots", "type": "conditional"},
+    {"source": "analyze_intent", "target": "generate_response", "type": "conditional"},
+    {"source": "search_properties", "target": "reflect", "type": "sequential"},
+    {"source": "reflect", "target": "generate_response", "type": "conditional"},
+    {"source": "reflect", "target": "search_properties", "type": "loop"},
+    {"source": "get_available_slots", "target": "collect_user_info", "type": "sequential"},
+    {"source": "collect_user_info", "target": "create_calendar_event", "type": "conditional"},
+    {"source": "collect_user_info", "target": "generate_response", "type": "conditional"},
+    {"source": "create_calendar_event", "target": "send_sms_confirmation", "type": "conditional"},
+    {"source": "create_calendar_event", "target": "generate_response", "type": "conditional"},
+    {"source": "send_sms_confirmation", "target": "generate_response", "type": "sequential"}
+]
+
+# Statuses that clear current_node, precomputed so the hot tracking path does
+# a frozenset membership test instead of building a list per call
+_TERMINAL_STATUSES = frozenset((NodeStatus.COMPLETED, NodeStatus.ERROR, NodeStatus.SKIPPED))
+
+# Nodes used per intent, as frozensets so skip_unused_nodes does O(1)
+# membership tests instead of scanning a list per node
+_INTENT_NODE_MAP = {
+    "property_search": frozenset({"analyze_intent", "search_properties", "reflect",
+                                  "generate_response"}),
+    "schedule_tour": frozenset({"analyze_intent", "get_available_slots",
+                                "collect_user_info", "create_calendar_event",
+                                "send_sms_confirmation", "generate_response"}),
+    "general_info": frozenset({"analyze_intent", "generate_response"})
+}
+_DEFAULT_USED_NODES = frozenset({"analyze_intent", "generate_response"})
+
+# Both sides of the skip decision are static, so the per-intent skip lists
+# are computed once at import instead of via a set difference per call
+_INTENT_SKIP_MAP = {
+    intent: tuple(node_id for node_id in WORKFLOW_NODES if node_id not in used)
+    for intent, used in _INTENT_NODE_MAP.items()
+}
+_DEFAULT_SKIP_NODES = tuple(node_id for node_id in WORKFLOW_NODES
+                            if node_id not in _DEFAULT_USED_NODES)
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+# Monotonic suffix for execution ids: the epoch prefix keeps ids readable
+# while the counter rules out collisions between same-second starts
+_exec_counter = itertools.count()
 
 class WorkflowVisualizer:
     """Integrated workflow visualizer that tracks LangGraph execution directly"""
@@ -49,102 +169,62 @@ class WorkflowVisualizer:
     NodeStatus = NodeStatus
     
     def __init__(self):
-        self.executions: Dict[str, WorkflowExecution] = {}
+        # Ordered so the oldest execution is evicted first once the cap is
+        # reached; without a bound this dict grows for the life of the server
+        self.executions: "OrderedDict[str, WorkflowExecution]" = OrderedDict()
+        self._max_executions = 1000
         self.current_execution: Optional[WorkflowExecution] = None
-        self.node_start_times: Dict[str, float] = {}
-        
-        # Complete workflow structure
-        self.workflow_nodes = {
-            "analyze_intent": {
-                "label": "Intent Analyzer",
-                "type": "processor",
-                "dependencies": [],
-                "expected_inputs": ["user_query", "user_id"],
-                "expected_outputs": ["intent", "entities", "confidence"]
-            },
-            "search_properties": {
-                "label": "Property Search", 
-                "type": "processor",
-                "dependencies": ["analyze_intent"],
-                "expected_inputs": ["intent", "search_criteria"],
-                "expected_outputs": ["properties", "search_results"]
-            },
-            "reflect": {
-                "label": "Reflection Engine",
-                "type": "decision",
-                "dependencies": ["search_properties"],
-                "expected_inputs": ["properties", "search_results"],
-                "expected_outputs": ["next_step", "reflection_summary"]
-            },
-            "get_available_slots": {
-                "label": "Available Slots",
-                "type": "processor", 
-                "dependencies": ["analyze_intent"],
-                "expected_inputs": ["property_id", "date_range"],
-                "expected_outputs": ["available_slots", "slot_count"]
-            },
-            "collect_user_info": {
-                "label": "User Info Collection",
-                "type": "processor",
-                "dependencies": ["get_available_slots"],
-                "expected_inputs": ["required_fields", "current_info"],
-                "expected_outputs": ["user_info", "missing_fields", "validation_status"]
-            },
-            "create_calendar_event": {
-                "label": "Calendar Manager",
-                "type": "processor",
-                "dependencies": ["collect_user_info"],
-                "expected_inputs": ["appointment_details", "user_info"],
-                "expected_outputs": ["calendar_event_id", "event_status"]
-            },
-            "send_sms_confirmation": {
-                "label": "SMS Sender",
-                "type": "processor",
-                "dependencies": ["create_calendar_event"],
-                "expected_inputs": ["phone_number", "appointment_details"],
-                "expected_outputs": ["sms_sent", "sms_status"]
-            },
-            "generate_response": {
-                "label": "Response Generator",
-                "type": "processor",
-                "dependencies": ["reflect", "send_sms_confirmation"],
-                "expected_inputs": ["workflow_state", "results"],
-                "expected_outputs": ["response_message", "suggested_actions"]
-            }
-        }
-        
-        # Workflow connections
-        self.workflow_connections = [
-            {"source": "analyze_intent", "target": "search_properties", "type": "conditional"},
-            {"source": "analyze_intent", "target": "get_available_slots", "type": "conditional"},
-            {"source": "analyze_intent", "target": "generate_response", "type": "conditional"},
-            {"source": "search_properties", "target": "reflect", "type": "sequential"},
-            {"source": "reflect", "target": "generate_response", "type": "conditional"},
-            {"source": "reflect", "target": "search_properties", "type": "loop"},
-            {"source": "get_available_slots", "target": "collect_user_info", "type": "sequential"},
-            {"source": "collect_user_info", "target": "create_calendar_event", "type": "conditional"},
-            {"source": "collect_user_info", "target": "generate_response", "type": "conditional"},
-            {"source": "create_calendar_event", "target": "send_sms_confirmation", "type": "conditional"},
-            {"source": "create_calendar_event", "target": "generate_response", "type": "conditional"},
-            {"source": "send_sms_confirmation", "target": "generate_response", "type": "sequential"}
-        ]
+        # Monotonic start marks for in-flight nodes: durations stay correct
+        # across wall-clock adjustments, and CLOCK_MONOTONIC is cheaper to read
+        self._node_monotonic_starts: Dict[str, float] = {}
+        # Bumped on every state mutation so push consumers (SSE) can detect
+        # changes without diffing execution payloads
+        self.state_version = 0
+        # Viewer accounting: open SSE streams plus the time of the last REST
+        # poll, so tracking can be skipped entirely when nobody is watching
+        self.sse_subscribers = 0
+        self._last_poll = 0.0
+        # Serialized executions cached per id: asdict deep-copies every node,
+        # which is wasted work for executions that can no longer change
+        self._serialized_cache: Dict[str, tuple] = {}
+        # Timestamp handed to the next track call so back-to-back stamps
+        # (start/complete + the follow-up node update) format time once
+        self._pending_timestamp: Optional[str] = None
+
+        # Shared, immutable workflow structure
+        self.workflow_nodes = WORKFLOW_NODES
+        self.workflow_connections = WORKFLOW_CONNECTIONS
+
+    def note_poll(self):
+        """Record that a visualization client hit a REST endpoint"""
+        self._last_poll = time.time()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """True when a client is watching: an open SSE stream or a recent poll"""
+        return self.sse_subscribers > 0 or (time.time() - self._last_poll) < 30.0
 
     async def start_execution(self, user_query: str, user_id: str) -> str:
         """Start tracking a new workflow execution"""
-        execution_id = f"exec_{int(time.time() * 1000)}"
+        execution_id = f"exec_{int(time.time())}_{next(_exec_counter)}"
         
+        start_ts = _now_iso()
         execution = WorkflowExecution(
             id=execution_id,
             user_query=user_query,
             user_id=user_id,
-            start_time=datetime.now().isoformat(),
+            start_time=start_ts,
             status="running"
         )
-        
+
         self.executions[execution_id] = execution
         self.current_execution = execution
-        
-        # Track workflow start
+        while len(self.executions) > self._max_executions:
+            evicted_id, _ = self.executions.popitem(last=False)
+            self._serialized_cache.pop(evicted_id, None)
+
+        # Track workflow start, reusing the timestamp just taken
+        self._pending_timestamp = start_ts
         await self.track_node_execution("analyze_intent", NodeStatus.RUNNING, 
                                       {"user_query": user_query, "user_id": user_id})
         
@@ -157,26 +237,30 @@ class WorkflowVisualizer:
         """Track node execution with status updates"""
         if not self.current_execution:
             return
-            
+
+        # One timestamp per call; callers that just stamped the execution
+        # hand their string over instead of formatting time again
+        ts = self._pending_timestamp
+        if ts is None:
+            ts = _now_iso()
+        else:
+            self._pending_timestamp = None
+
         # Calculate duration if completing a node
         duration_ms = None
-        if status == NodeStatus.COMPLETED and node_id in self.node_start_times:
-            duration_ms = int((time.time() - self.node_start_times[node_id]) * 1000)
-            del self.node_start_times[node_id]
+        if status == NodeStatus.COMPLETED and node_id in self._node_monotonic_starts:
+            duration_ms = int((time.monotonic() - self._node_monotonic_starts[node_id]) * 1000)
+            del self._node_monotonic_starts[node_id]
         elif status == NodeStatus.RUNNING:
-            self.node_start_times[node_id] = time.time()
+            self._node_monotonic_starts[node_id] = time.monotonic()
             
-        # Find existing node execution or create new one
-        existing_node = None
-        for node in self.current_execution.nodes:
-            if node.node_id == node_id:
-                existing_node = node
-                break
-                
+        # Find existing node execution or create new one (O(1) index lookup)
+        existing_node = self.current_execution.nodes_by_id.get(node_id)
+
         if existing_node:
             # Update existing node
             existing_node.status = status
-            existing_node.timestamp = datetime.now().isoformat()
+            existing_node.timestamp = ts
             if output_data:
                 existing_node.output_data.update(output_data)
             if duration_ms:
@@ -190,36 +274,64 @@ class WorkflowVisualizer:
                 status=status,
                 input_data=input_data or {},
                 output_data=output_data or {},
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 duration_ms=duration_ms,
                 error_message=error_message
             )
             self.current_execution.nodes.append(node_execution)
+            self.current_execution.nodes_by_id[node_id] = node_execution
             
         # Update current node
         if status == NodeStatus.RUNNING:
             self.current_execution.current_node = node_id
-        elif status in [NodeStatus.COMPLETED, NodeStatus.ERROR, NodeStatus.SKIPPED]:
+        elif status in _TERMINAL_STATUSES:
             self.current_execution.current_node = None
 
+        self.state_version += 1
+
     async def complete_execution(self, final_data: Dict[str, Any] = None):
         """Complete the current workflow execution"""
         if not self.current_execution:
             return
             
-        self.current_execution.end_time = datetime.now().isoformat()
+        end_ts = _now_iso()
+        self.current_execution.end_time = end_ts
         self.current_execution.status = "completed"
-        
-        # Ensure generate_response is marked as completed
+
+        # Ensure generate_response is marked as completed, reusing the stamp
+        self._pending_timestamp = end_ts
         await self.track_node_execution("generate_response", NodeStatus.COMPLETED,
                                       output_data=final_data or {})
 
+    def _serialize_execution(self, execution: WorkflowExecution) -> Dict[str, Any]:
+        """Serialize one execution, reusing the cached form when it cannot
+        have changed (still-running executions are always re-serialized)"""
+        if execution.status == "running":
+            return asdict(execution)
+
+        key = (execution.status, len(execution.nodes), execution.end_time)
+        cached = self._serialized_cache.get(execution.id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        serialized = asdict(execution)
+        self._serialized_cache[execution.id] = (key, serialized)
+        return serialized
+
     def get_workflow_structure(self) -> Dict[str, Any]:
         """Get complete workflow structure for visualization"""
+        # Drop cache entries for executions that were cleared
+        if len(self._serialized_cache) > len(self.executions):
+            self._serialized_cache = {
+                exec_id: entry for exec_id, entry in self._serialized_cache.items()
+                if exec_id in self.executions
+            }
+
         return {
             "nodes": self.workflow_nodes,
             "connections": self.workflow_connections,
-            "executions": {exec_id: asdict(execution) for exec_id, execution in self.executions.items()}
+            "executions": {exec_id: self._serialize_execution(execution)
+                           for exec_id, execution in self.executions.items()}
         }
 
     def get_current_execution_data(self) -> Dict[str, Any]:
@@ -235,22 +347,35 @@ class WorkflowVisualizer:
             }
         }
 
+    def _bulk_skip(self, node_ids) -> None:
+        """Mark several nodes as skipped in one pass: a single timestamp and
+        version bump instead of the full per-node tracking path"""
+        execution = self.current_execution
+        if not execution:
+            return
+
+        ts = _now_iso()
+        for node_id in node_ids:
+            existing_node = execution.nodes_by_id.get(node_id)
+            if existing_node:
+                existing_node.status = NodeStatus.SKIPPED
+                existing_node.timestamp = ts
+            else:
+                node_execution = NodeExecution(
+                    node_id=node_id,
+                    status=NodeStatus.SKIPPED,
+                    input_data={},
+                    output_data={},
+                    timestamp=ts
+                )
+                execution.nodes.append(node_execution)
+                execution.nodes_by_id[node_id] = node_execution
+
+        self.state_version += 1
+
     async def skip_unused_nodes(self, intent: str):
         """Mark nodes as skipped based on workflow path"""
-        # Define which nodes are used for different intents
-        intent_node_map = {
-            "property_search": ["analyze_intent", "search_properties", "reflect", "generate_response"],
-            "schedule_tour": ["analyze_intent", "get_available_slots", "collect_user_info", 
-                            "create_calendar_event", "send_sms_confirmation", "generate_response"],
-            "general_info": ["analyze_intent", "generate_response"]
-        }
-        
-        used_nodes = intent_node_map.get(intent, ["analyze_intent", "generate_response"])
-        
-        # Skip unused nodes
-        for node_id in self.workflow_nodes.keys():
-            if node_id not in used_nodes:
-                await self.track_node_execution(node_id, NodeStatus.SKIPPED)
+        self._bulk_skip(_INTENT_SKIP_MAP.get(intent, _DEFAULT_SKIP_NODES))
 
 # Global visualizer instance
 workflow_visualizer = WorkflowVisualizer()
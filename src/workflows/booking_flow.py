@@ -2,14 +2,73 @@
 Interactive booking flow management for property scheduling
 """
 from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import asyncio
+import copy
 import logging
 import re
-from src.services.property_details_service import property_details_service
-from src.services.property_service import PropertyService
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.services.property_service import PropertyService
 
 logger = logging.getLogger(__name__)
 
+# Validation patterns compiled once at import; the per-call re.* form pays a
+# pattern-cache lookup on every field validation
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\.+]')
+_FAKE_PHONES = frozenset({'1234567890', '0000000000', '1111111111'})
+# Characters allowed in names besides letters, stripped in one translate pass
+_NAME_STRIP = str.maketrans('', '', " -'")
+
+# LRU bound for memoized read-only handler responses
+_MAX_HANDLER_CACHE = 128
+
+# How long a fetched property catalog stays fresh
+_PROPS_TTL = 60.0
+
+# Fixed daily slot times as (id suffix, display label, ISO time); only the
+# date part varies per day, so these never need re-deriving
+_SLOT_TEMPLATES = [
+    ('09:00', '9:00 AM', '09:00:00'),
+    ('11:00', '11:00 AM', '11:00:00'),
+    ('14:00', '2:00 PM', '14:00:00'),
+    ('16:00', '4:00 PM', '16:00:00'),
+]
+
+# Baseline shape shared by every handler response; handlers copy it and
+# overlay their own keys, so optional fields are always present with their
+# defaults instead of depending on each call site remembering them
+_DEFAULT_RESPONSE = {
+    'requires_user_info': False,
+    'next_field': None,
+    'missing_fields': (),
+    'info_prompt': None,
+    'appointment_details': None,
+    'workflow_complete': False,
+}
+
+# Shared service instance, created on first use instead of per inquiry; the
+# service module (and its LLM/DB setup) is only imported on the inquiry path,
+# keeping module load cheap for workers that never take it
+_property_service: Optional["PropertyService"] = None
+
+# The property services are synchronous; running them on a shared pool keeps
+# blocking catalog/detail I/O off the event loop during concurrent bookings
+_details_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='propdetails')
+
+
+def _get_property_service() -> "PropertyService":
+    global _property_service
+    if _property_service is None:
+        from src.services.property_service import PropertyService
+        _property_service = PropertyService()
+    return _property_service
+
 
 class BookingFlowManager:
     """Manages the interactive booking flow state and transitions"""
@@ -22,7 +81,15 @@ class BookingFlowManager:
             'info_collection': self._handle_info_collection,
             'booking_confirmation': self._handle_booking_confirmation
         }
-        self.required_fields_order = ['name', 'email', 'phone', 'pets']
+        self.required_fields_order = ('name', 'email', 'phone', 'pets')
+        # Generated slots are identical for a whole calendar day; cache them
+        # keyed by date so repeat bookings skip the strftime-heavy rebuild
+        self._slots_cache: Optional[tuple] = None
+        # Memoized responses for pure read actions (e.g. re-inquiring the
+        # same property); stateful transitions are never cached
+        self._handler_cache: OrderedDict = OrderedDict()
+        # TTL cache of the full catalog: (fetched_at, list, id index)
+        self._all_props_cache: Optional[tuple] = None
     
     async def process_user_action(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Process user action and determine next step"""
@@ -30,7 +97,25 @@ class BookingFlowManager:
         current_step = state.get('current_step', 'property_search')
         
         if action_type == 'inquire':
-            return await self._handle_property_inquiry(state)
+            # Pure read: re-inquiring the same property returns the cached
+            # response without reloading property details. Entries are deep
+            # copied on both store and hit so callers can't mutate the
+            # cached nested detail dicts.
+            key = ('inquire', str(state.get('property_id')))
+            cached = self._handler_cache.get(key)
+            if cached is not None:
+                self._handler_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+            result = await self._handle_property_inquiry(state)
+            # Only successful lookups are memoized: a not-found answer goes
+            # stale as soon as the catalog cache refreshes, and it tells the
+            # user to retry - retries must not be served from this cache
+            if result.get('property_details') is not None:
+                self._handler_cache[key] = copy.deepcopy(result)
+                if len(self._handler_cache) > _MAX_HANDLER_CACHE:
+                    self._handler_cache.popitem(last=False)
+            return result
         elif action_type == 'book_schedule':
             return await self._handle_booking_request(state)
         elif action_type == 'select_slot':
@@ -43,12 +128,18 @@ class BookingFlowManager:
             handler = self.flow_steps.get(current_step, self._handle_property_search)
             return await handler(state)
     
-    def _next_missing_field(self, user_info: Dict[str, Any]) -> Optional[str]:
-        for field in self.required_fields_order:
-            if not user_info.get(field):
-                return field
-        return None
+    def _scan_missing(self, user_info: Dict[str, Any]) -> tuple:
+        """Collect all missing required fields in one pass; returns
+        (next missing field or None, tuple of all missing fields)"""
+        missing = tuple(f for f in self.required_fields_order if not user_info.get(f))
+        return (missing[0] if missing else None, missing)
     
+    def _resp(self, **overrides) -> Dict[str, Any]:
+        """Build a handler response from the shared default shape"""
+        response = _DEFAULT_RESPONSE.copy()
+        response.update(overrides)
+        return response
+
     def _prompt_for_field(self, field_name: str) -> str:
         prompts = {
             'name': "What's your full name?",
@@ -59,30 +150,39 @@ class BookingFlowManager:
         return prompts.get(field_name, 'Please provide the requested information.')
     
     def _handle_cancel(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'current_step': 'property_search',
-            'response_message': 'Booking canceled. You can start again when ready.',
-            'available_slots': [],
-            'requires_user_info': False,
-            'next_field': None,
-            'missing_fields': [],
-            'info_prompt': None,
-            'appointment_details': None,
-            'workflow_complete': False,
-            'suggested_actions': ['search_properties', 'book_schedule']
-        }
-    
+        return self._resp(
+            current_step='property_search',
+            response_message='Booking canceled. You can start again when ready.',
+            available_slots=[],
+            suggested_actions=['search_properties', 'book_schedule']
+        )
+
     async def _handle_property_search(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'current_step': 'property_search',
-            'response_message': 'Here are the available properties. Click "Inquire" for details or "Book Schedule" to view available times.',
-            'suggested_actions': ['inquire', 'book_schedule']
-        }
+        return self._resp(
+            current_step='property_search',
+            response_message='Here are the available properties. Click "Inquire" for details or "Book Schedule" to view available times.',
+            suggested_actions=['inquire', 'book_schedule']
+        )
     
+    def _get_all_properties_indexed(self) -> tuple:
+        """Fetch the property catalog with its id index, reusing a recent
+        fetch instead of hitting the service on every inquiry"""
+        cached = self._all_props_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < _PROPS_TTL:
+            return cached[1], cached[2]
+
+        all_props = _get_property_service().get_all_properties()
+        index = {str(p.get('id')): p for p in all_props}
+        self._all_props_cache = (now, all_props, index)
+        return all_props, index
+
     async def _handle_property_inquiry(self, state: Dict[str, Any]) -> Dict[str, Any]:
         property_id = state.get('property_id')
         properties = state.get('properties', [])
-        
+        str_id = str(property_id)
+
+        loop = asyncio.get_running_loop()
         selected_property = None
         if properties:
             for prop in properties:
@@ -91,70 +191,73 @@ class BookingFlowManager:
                     break
         else:
             try:
-                service = PropertyService()
-                all_props = service.get_all_properties()
-                for prop in all_props:
-                    if str(prop.get('id')) == str(property_id):
-                        selected_property = prop
-                        properties = all_props
-                        break
+                all_props, index = await loop.run_in_executor(
+                    _details_pool, self._get_all_properties_indexed)
+                selected_property = index.get(str_id)
+                if selected_property:
+                    properties = all_props
             except Exception:
                 selected_property = None
-        
+
         if not selected_property:
-            return {
-                'response_message': 'Property not found. Please try again.',
-                'current_step': 'property_search'
-            }
-        
-        details = property_details_service.get_property_details(property_id, properties)
+            return self._resp(
+                response_message='Property not found. Please try again.',
+                current_step='property_search'
+            )
+
+        # Imported on first inquiry; later calls resolve from sys.modules
+        from src.services.property_details_service import property_details_service
+
+        details = await loop.run_in_executor(
+            _details_pool, property_details_service.get_property_details,
+            property_id, properties)
         
-        return {
-            'current_step': 'property_details',
-            'response_message': f"Here are the details for {selected_property.get('address', 'this property')}:",
-            'property_details': details,
-            'suggested_actions': ['book_schedule', 'back_to_search']
-        }
+        return self._resp(
+            current_step='property_details',
+            response_message=f"Here are the details for {selected_property.get('address', 'this property')}:",
+            property_details=details,
+            suggested_actions=['book_schedule', 'back_to_search']
+        )
     
     async def _handle_booking_request(self, state: Dict[str, Any]) -> Dict[str, Any]:
         property_id = state.get('property_id')
         
         if not property_id:
-            return {
-                'response_message': 'Please select a property first.',
-                'current_step': 'property_search'
-            }
-        
+            return self._resp(
+                response_message='Please select a property first.',
+                current_step='property_search'
+            )
+
         available_slots = self._generate_available_slots()
-        
-        return {
-            'current_step': 'slot_selection',
-            'response_message': 'Please select an available time slot for your property visit:',
-            'available_slots': available_slots,
-            'suggested_actions': ['select_slot', 'cancel_booking']
-        }
+
+        return self._resp(
+            current_step='slot_selection',
+            response_message='Please select an available time slot for your property visit:',
+            available_slots=available_slots,
+            suggested_actions=['select_slot', 'cancel_booking']
+        )
     
     async def _handle_slot_selection(self, state: Dict[str, Any]) -> Dict[str, Any]:
         selected_slot = state.get('selected_slot')
         if not selected_slot:
-            return {
-                'response_message': 'Please select a time slot.',
-                'current_step': 'slot_selection'
-            }
-        
+            return self._resp(
+                response_message='Please select a time slot.',
+                current_step='slot_selection'
+            )
+
         user_info = state.get('user_info', {}) or {}
-        next_field = self._next_missing_field(user_info)
+        next_field, missing_fields = self._scan_missing(user_info)
         if next_field:
             prompt = self._prompt_for_field(next_field)
-            return {
-                'current_step': 'info_collection',
-                'response_message': 'To complete your booking, please provide the following information:',
-                'requires_user_info': True,
-                'missing_fields': [f for f in self.required_fields_order if not user_info.get(f)],
-                'next_field': next_field,
-                'info_prompt': prompt,
-                'suggested_actions': ['provide_info', 'cancel_booking']
-            }
+            return self._resp(
+                current_step='info_collection',
+                response_message='To complete your booking, please provide the following information:',
+                requires_user_info=True,
+                missing_fields=missing_fields,
+                next_field=next_field,
+                info_prompt=prompt,
+                suggested_actions=['provide_info', 'cancel_booking']
+            )
         else:
             return await self._handle_booking_confirmation(state)
     
@@ -171,21 +274,20 @@ class BookingFlowManager:
         if field_name == 'name':
             if len(value) < 2:
                 errors['name'] = 'Name must be at least 2 characters long'
-            elif not value.replace(' ', '').replace('-', '').replace("'", '').isalpha():
+            elif not value.translate(_NAME_STRIP).isalpha():
                 errors['name'] = 'Name can only contain letters, spaces, hyphens, and apostrophes'
             elif len(value) > 100:
                 errors['name'] = 'Name is too long (maximum 100 characters)'
                 
         elif field_name == 'email':
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, value):
+            if not _EMAIL_RE.match(value):
                 errors['email'] = 'Please enter a valid email address (e.g., john@example.com)'
             elif len(value) > 254:
                 errors['email'] = 'Email address is too long'
-                
+
         elif field_name == 'phone':
             # Remove common formatting characters
-            clean_phone = re.sub(r'[\s\-\(\)\.+]', '', value)
+            clean_phone = _PHONE_STRIP_RE.sub('', value)
             if not clean_phone.isdigit():
                 errors['phone'] = 'Phone number can only contain digits and formatting characters'
             elif len(clean_phone) < 10:
@@ -193,7 +295,7 @@ class BookingFlowManager:
             elif len(clean_phone) > 15:
                 errors['phone'] = 'Phone number is too long'
             # Check for obviously fake numbers
-            elif clean_phone in ['1234567890', '0000000000', '1111111111']:
+            elif clean_phone in _FAKE_PHONES:
                 errors['phone'] = 'Please enter a valid phone number'
                 
         elif field_name == 'pets':
@@ -204,39 +306,45 @@ class BookingFlowManager:
 
     async def _handle_info_collection(self, state: Dict[str, Any]) -> Dict[str, Any]:
         user_info = state.get('user_info', {}) or {}
-        
+        # Fields that already passed validation in earlier turns are seeded
+        # into state from the server-side session (see the chat endpoint), so
+        # each submission only validates what is new
+        validated = set(state.get('validated_fields') or ())
+
         # If we have user_info with a new field, validate it
         if state.get('action_type') == 'provide_info':
-            # The latest field should be validated
             for field_name in self.required_fields_order:
-                if field_name in user_info:
+                if field_name in user_info and field_name not in validated:
                     field_value = user_info[field_name]
                     validation_errors = self._validate_user_field(field_name, field_value)
                     if validation_errors:
-                        return {
-                            'current_step': 'info_collection',
-                            'response_message': f"Invalid {field_name}: {validation_errors[field_name]}. Please try again:",
-                            'requires_user_info': True,
-                            'next_field': field_name,
-                            'info_prompt': self._prompt_for_field(field_name),
-                            'validation_error': True,
-                            'suggested_actions': ['provide_info', 'cancel_booking']
-                        }
-        
-        next_field = self._next_missing_field(user_info)
-        
+                        return self._resp(
+                            current_step='info_collection',
+                            response_message=f"Invalid {field_name}: {validation_errors[field_name]}. Please try again:",
+                            requires_user_info=True,
+                            next_field=field_name,
+                            info_prompt=self._prompt_for_field(field_name),
+                            validation_error=True,
+                            validated_fields=tuple(validated),
+                            suggested_actions=['provide_info', 'cancel_booking']
+                        )
+                    validated.add(field_name)
+
+        next_field, missing_fields = self._scan_missing(user_info)
+
         if next_field:
             prompt = self._prompt_for_field(next_field)
-            return {
-                'current_step': 'info_collection',
-                'response_message': prompt,
-                'requires_user_info': True,
-                'missing_fields': [f for f in self.required_fields_order if not user_info.get(f)],
-                'next_field': next_field,
-                'info_prompt': prompt,
-                'suggested_actions': ['provide_info', 'cancel_booking']
-            }
-        
+            return self._resp(
+                current_step='info_collection',
+                response_message=prompt,
+                requires_user_info=True,
+                missing_fields=missing_fields,
+                next_field=next_field,
+                info_prompt=prompt,
+                validated_fields=tuple(validated),
+                suggested_actions=['provide_info', 'cancel_booking']
+            )
+
         return await self._handle_booking_confirmation(state)
     
     async def _handle_booking_confirmation(self, state: Dict[str, Any]) -> Dict[str, Any]:
@@ -254,13 +362,13 @@ class BookingFlowManager:
             'created_at': datetime.now().isoformat()
         }
         
-        return {
-            'current_step': 'booking_complete',
-            'response_message': f"Great! Your appointment has been scheduled for {selected_slot}. You'll receive a confirmation SMS shortly.",
-            'appointment_details': appointment_details,
-            'workflow_complete': True,
-            'suggested_actions': ['booking_confirmed', 'new_search']
-        }
+        return self._resp(
+            current_step='booking_complete',
+            response_message=f"Great! Your appointment has been scheduled for {selected_slot}. You'll receive a confirmation SMS shortly.",
+            appointment_details=appointment_details,
+            workflow_complete=True,
+            suggested_actions=['booking_confirmed', 'new_search']
+        )
     
     def _generate_property_details(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -275,39 +383,28 @@ class BookingFlowManager:
         }
     
     def _generate_available_slots(self) -> List[Dict[str, Any]]:
+        today_key = datetime.now().strftime('%Y-%m-%d')
+        if self._slots_cache and self._slots_cache[0] == today_key:
+            return self._slots_cache[1]
+
         slots = []
         base_date = datetime.now() + timedelta(days=1)
         for day_offset in range(7):
             date = base_date + timedelta(days=day_offset)
-            day_name = date.strftime('%A')
+            # One strftime pass per day; the slot times come from the
+            # templates above
+            day_label = date.strftime('%A, %B %d')
             date_str = date.strftime('%Y-%m-%d')
-            slots.extend([
-                {
-                    'id': f"{date_str}_09:00",
-                    'display': f"{day_name}, {date.strftime('%B %d')} at 9:00 AM",
-                    'datetime': f"{date_str} 09:00:00",
-                    'available': True
-                },
-                {
-                    'id': f"{date_str}_11:00",
-                    'display': f"{day_name}, {date.strftime('%B %d')} at 11:00 AM",
-                    'datetime': f"{date_str} 11:00:00",
-                    'available': True
-                },
-                {
-                    'id': f"{date_str}_14:00",
-                    'display': f"{day_name}, {date.strftime('%B %d')} at 2:00 PM",
-                    'datetime': f"{date_str} 14:00:00",
-                    'available': True
-                },
-                {
-                    'id': f"{date_str}_16:00",
-                    'display': f"{day_name}, {date.strftime('%B %d')} at 4:00 PM",
-                    'datetime': f"{date_str} 16:00:00",
+            for time_id, time_display, time_iso in _SLOT_TEMPLATES:
+                slots.append({
+                    'id': f"{date_str}_{time_id}",
+                    'display': f"{day_label} at {time_display}",
+                    'datetime': f"{date_str} {time_iso}",
                     'available': True
-                }
-            ])
-        return slots[:10]
+                })
+        slots = slots[:10]
+        self._slots_cache = (today_key, slots)
+        return slots
 
 
 booking_flow_manager = BookingFlowManager()
\ No newline at end of file
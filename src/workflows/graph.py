@@ -2,15 +2,66 @@
 LangGraph Workflow Definition
 """
 
+import hashlib
+from datetime import date
+from functools import cache, wraps
+
+from langgraph.cache.memory import InMemoryCache
+from langgraph.constants import Send
 from langgraph.graph import StateGraph, END
+from langgraph.types import CachePolicy
 from src.workflows.state import WorkflowState
 from src.workflows.workflow_nodes import WorkflowNodes
 from src.workflows.configuration import Configuration
 
 
-def create_property_workflow() -> StateGraph:
-    """Create the main property management workflow graph"""
-    
+def _intent_cache_key(state: WorkflowState) -> str:
+    """Cache key for analyze_intent: identical queries (retries, reflect
+    loops resubmitting the same text) skip the LLM round-trip"""
+    return hashlib.blake2b(state["user_query"].strip().lower().encode()).hexdigest()
+
+
+def _slots_cache_key(state: WorkflowState) -> str:
+    """Cache key for get_available_slots: the fixed next-day slot list only
+    changes with the calendar date"""
+    return date.today().isoformat()
+
+
+# Routing tables and field lists are static; built once here instead of per
+# router invocation
+_INTENT_ROUTES = {
+    "property_search": "search_properties",
+    "schedule_tour": "fork_booking",
+    "confirm_booking": "create_calendar_event",
+    # For non-property/ecommerce queries, skip searching and go straight to response
+    "non_property": "generate_response"
+}
+_VALID_ROUTES = frozenset({
+    "search_properties", "get_available_slots", "collect_user_info",
+    "create_calendar_event", "finalize_booking", "generate_response"
+})
+_REQUIRED_BOOKING_FIELDS = ("user_name", "user_email", "user_phone", "user_pets")
+_EMPTY: dict = {}
+
+
+def _budget_guard(counter_key: str, max_key: str, default_max: int,
+                  fallback: str = "generate_response"):
+    """Wrap a router with its loop budget: when the state counter reaches the
+    configured cap the router short-circuits to the fallback, so the
+    cap-exceeded branch lives in one place instead of every router body"""
+    def decorator(router):
+        @wraps(router)
+        def wrapper(state: WorkflowState) -> str:
+            if state.get(counter_key, 0) >= state.get(max_key, default_max):
+                return fallback
+            return router(state)
+        return wrapper
+    return decorator
+
+
+def _build_workflow() -> StateGraph:
+    """Build and compile the main property management workflow graph"""
+
     # Initialize nodes
     nodes = WorkflowNodes()
     
@@ -18,13 +69,29 @@ def create_property_workflow() -> StateGraph:
     workflow = StateGraph(WorkflowState, config_schema=Configuration)
     
     # Add nodes
-    workflow.add_node("analyze_intent", nodes.analyze_intent)
+    workflow.add_node("analyze_intent", nodes.analyze_intent,
+                      cache_policy=CachePolicy(key_func=_intent_cache_key, ttl=300))
     workflow.add_node("search_properties", nodes.search_properties)
     workflow.add_node("reflect", nodes.reflect)
-    workflow.add_node("get_available_slots", nodes.get_available_slots)
+    workflow.add_node("get_available_slots", nodes.get_available_slots,
+                      cache_policy=CachePolicy(key_func=_slots_cache_key, ttl=60))
     workflow.add_node("collect_user_info", nodes.collect_user_info)
+
+    # Fork/join pair for the booking path: slot lookup and user-info
+    # extraction are independent I/O, so they run in the same superstep and
+    # the join waits for both before the calendar decision
+    async def fork_booking(state: WorkflowState) -> dict:
+        return {}
+
+    async def join_booking(state: WorkflowState) -> dict:
+        return {}
+
+    workflow.add_node("fork_booking", fork_booking)
+    workflow.add_node("join_booking", join_booking)
     workflow.add_node("create_calendar_event", nodes.create_calendar_event)
-    workflow.add_node("send_sms_confirmation", nodes.send_sms_confirmation)
+    # Post-booking fanout: SMS confirmation runs concurrently with response
+    # generation inside one node (see WorkflowNodes.finalize_booking)
+    workflow.add_node("finalize_booking", nodes.finalize_booking)
     workflow.add_node("generate_response", nodes.generate_response)
     
     # Set entry point - start with intent analysis to route properly
@@ -33,72 +100,57 @@ def create_property_workflow() -> StateGraph:
     # Define routing functions using LangGraph's conditional routing
     def route_from_intent(state: WorkflowState) -> str:
         """Route from analyze_intent based on intent type"""
-        intent = state.get("intent", "general_info")
-        
-        # Intent-based routing map
-        intent_routes = {
-            "property_search": "search_properties",
-            "schedule_tour": "get_available_slots", 
-            "confirm_booking": "create_calendar_event",
-            # For non-property/ecommerce queries, skip searching and go straight to response
-            "non_property": "generate_response"
-        }
-        
-        return intent_routes.get(intent, "generate_response")
-    
+        return _INTENT_ROUTES.get(state.get("intent", "general_info"),
+                                  "generate_response")
+
     def route_next_step(state: WorkflowState) -> str:
         """Route to next step based on workflow state"""
         next_step = state.get("next_step", "generate_response")
-        
         # Valid routing options - LangGraph will handle invalid routes
-        valid_routes = {
-            "search_properties", "get_available_slots", "collect_user_info",
-            "create_calendar_event", "send_sms_confirmation", "generate_response"
-        }
-        
-        return next_step if next_step in valid_routes else "generate_response"
-    
+        return next_step if next_step in _VALID_ROUTES else "generate_response"
+
+    @_budget_guard("search_iterations", "max_search_iterations", 3)
     def route_after_search(state: WorkflowState) -> str:
         """Route after property search - always go to response generation"""
         # Check if we have a fallback context indicating no criteria
-        fallback_context = state.get("fallback_context", {})
+        fallback_context = state.get("fallback_context") or _EMPTY
         if fallback_context.get("type") == "need_criteria":
             return "generate_response"
-        
-        # Check if we've exceeded max search iterations to prevent infinite loops
-        search_count = state.get("search_iterations", 0)
-        max_iterations = state.get("max_search_iterations", 3)
-        
-        if search_count >= max_iterations:
-            return "generate_response"
-        
+
         # Check if we have properties or need to reflect
-        properties = state.get("properties", [])
-        if properties:
+        if state.get("properties"):
             return "generate_response"
-        
-        # Only go to reflect if we haven't exceeded max iterations
+
+        # Only go to reflect while under the search budget
         return "reflect"
     
-    def route_after_slots(state: WorkflowState) -> str:
-        """Route after getting available slots"""
-        # Always go to user info collection after showing slots
-        return "collect_user_info"
-    
+    def fan_out_booking(state: WorkflowState) -> list:
+        """Send slot lookup and user-info collection off concurrently"""
+        return [Send("get_available_slots", state),
+                Send("collect_user_info", state)]
+
     def route_after_user_info(state: WorkflowState) -> str:
         """Route after collecting user info"""
-        # Check if we have all required info for booking
-        required_fields = ["user_name", "user_email", "user_phone", "user_pets"]
-        if all(state.get(field) for field in required_fields):
+        # collect_user_info always writes the four fields (possibly None), so
+        # direct subscripts skip the get() machinery; the KeyError fallback
+        # covers the error-handler path that writes only "error"
+        try:
+            for field in _REQUIRED_BOOKING_FIELDS:
+                if not state[field]:
+                    return "generate_response"
             return "create_calendar_event"
-        return "generate_response"
+        except KeyError:
+            return "generate_response"
     
     def route_after_calendar(state: WorkflowState) -> str:
         """Route after creating calendar event"""
-        # If event created successfully, send SMS
-        if state.get("calendar_event_id"):
-            return "send_sms_confirmation"
-        return "generate_response"
+        # If event created successfully, finalize (SMS + response together);
+        # on failure the node writes only "error", which the KeyError
+        # fallback covers
+        try:
+            return "finalize_booking" if state["calendar_event_id"] else "generate_response"
+        except KeyError:
+            return "generate_response"
     
     # Add conditional edges using specific routing functions
     workflow.add_conditional_edges(
@@ -106,7 +158,7 @@ def create_property_workflow() -> StateGraph:
         route_from_intent,
         {
             "search_properties": "search_properties",
-            "get_available_slots": "get_available_slots",
+            "fork_booking": "fork_booking",
             "create_calendar_event": "create_calendar_event",
             "generate_response": "generate_response"
         }
@@ -123,17 +175,12 @@ def create_property_workflow() -> StateGraph:
     )
     
     # Reflection routing: either loop to search or finalize
+    @_budget_guard("reflection_loops", "max_research_loops", 1)
     def route_after_reflect(state: WorkflowState) -> str:
         """Route after reflection - prevent infinite loops"""
-        # Check if we've exceeded max research loops
-        reflection_count = state.get("reflection_loops", 0)
-        max_loops = state.get("max_research_loops", 1)
-        
-        if reflection_count >= max_loops:
-            return "generate_response"
-        
-        next_step = state.get("next_step", "generate_response")
-        return next_step if next_step in {"search_properties", "generate_response"} else "generate_response"
+        if state.get("next_step") == "search_properties":
+            return "search_properties"
+        return "generate_response"
 
     workflow.add_conditional_edges(
         "reflect",
@@ -144,19 +191,17 @@ def create_property_workflow() -> StateGraph:
         }
     )
 
-    # Available slots routing based on user info
+    # Booking fork: both prerequisites run concurrently, then join
     workflow.add_conditional_edges(
-        "get_available_slots",
-        route_after_slots,
-        {
-            "collect_user_info": "collect_user_info",
-            "generate_response": "generate_response"
-        }
+        "fork_booking",
+        fan_out_booking,
+        ["get_available_slots", "collect_user_info"]
     )
-    
-    # User info collection routing
+    workflow.add_edge(["get_available_slots", "collect_user_info"], "join_booking")
+
+    # After the join, the calendar decision uses the merged state
     workflow.add_conditional_edges(
-        "collect_user_info",
+        "join_booking",
         route_after_user_info,
         {
             "create_calendar_event": "create_calendar_event",
@@ -169,23 +214,20 @@ def create_property_workflow() -> StateGraph:
         "create_calendar_event",
         route_after_calendar,
         {
-            "send_sms_confirmation": "send_sms_confirmation",
+            "finalize_booking": "finalize_booking",
             "generate_response": "generate_response"
         }
     )
-    
-    # SMS confirmation always goes to response
-    workflow.add_conditional_edges(
-        "send_sms_confirmation",
-        lambda state: "generate_response",
-        {"generate_response": "generate_response"}
-    )
-    
+
+    # finalize_booking already produced the response, so it ends the run
+    workflow.add_edge("finalize_booking", END)
+
     # Add edge from generate_response to END
     workflow.add_edge("generate_response", END)
     
-    # Compile with recursion limit configuration
-    compiled_workflow = workflow.compile()
+    # Compile with recursion limit configuration and the node cache backing
+    # the CachePolicy entries above
+    compiled_workflow = workflow.compile(cache=InMemoryCache())
     
     # Set default configuration to prevent infinite loops
     compiled_workflow.config = {
@@ -196,6 +238,16 @@ def create_property_workflow() -> StateGraph:
     
     return compiled_workflow
 
+
+@cache
+def create_property_workflow() -> StateGraph:
+    """Return the shared compiled workflow graph.
+
+    The compiled graph is stateless across requests, so the node/edge build
+    and compile run once; every caller gets the same instance.
+    """
+    return _build_workflow()
+
 # -----------------------------------------------------------------------------
 # Workflow Graph Visualization (for quick reference)
 #
@@ -203,15 +255,17 @@ def create_property_workflow() -> StateGraph:
 # - analyze_intent           : Entry / router (decides next step based on intent)
 # - search_properties        : Property search (may lead to reflect or directly to response)
 # - reflect                  : Decision node to refine search or finalize
+# - fork_booking             : Fan-out point for the booking prerequisites
 # - get_available_slots      : Retrieves appointment slots (booking flow)
 # - collect_user_info        : Gathers user details required for booking
+# - join_booking             : Waits for both prerequisites, then routes
 # - create_calendar_event    : Creates Google Calendar event
-# - send_sms_confirmation    : Sends SMS confirmation for booking
+# - finalize_booking         : Runs SMS confirmation + response concurrently (then END)
 # - generate_response        : Final response aggregator (then END)
 #
 # Edges (routing conditions):
 # - analyze_intent -> search_properties      [intent == "property_search"]
-# - analyze_intent -> get_available_slots    [intent == "schedule_tour"]
+# - analyze_intent -> fork_booking           [intent == "schedule_tour"]
 # - analyze_intent -> create_calendar_event  [intent == "confirm_booking"]
 # - analyze_intent -> generate_response      [else or intent == "non_property"]
 #
@@ -221,13 +275,14 @@ def create_property_workflow() -> StateGraph:
 # - reflect -> search_properties             [next_step == "search_properties" AND loop limit not exceeded]
 # - reflect -> generate_response             [else]
 #
-# - get_available_slots -> collect_user_info [always]
-# - collect_user_info -> create_calendar_event [have user_name, user_email, user_phone, user_pets]
-# - collect_user_info -> generate_response   [missing required info]
+# - fork_booking -> get_available_slots + collect_user_info [concurrent Sends]
+# - get_available_slots, collect_user_info -> join_booking   [join on both]
+# - join_booking -> create_calendar_event [have user_name, user_email, user_phone, user_pets]
+# - join_booking -> generate_response     [missing required info]
 #
-# - create_calendar_event -> send_sms_confirmation [calendar_event_id set]
-# - create_calendar_event -> generate_response     [else]
-# - send_sms_confirmation -> generate_response     [always]
+# - create_calendar_event -> finalize_booking  [calendar_event_id set]
+# - create_calendar_event -> generate_response [else]
+# - finalize_booking -> END                    [SMS and response overlap inside the node]
 # - generate_response -> END
 #
 # ASCII map (monospace view):
@@ -249,11 +304,11 @@ def create_property_workflow() -> StateGraph:
 #                       v
 #                search_properties (loop)
 #
-#    (schedule_tour)
-# analyze_intent ---------------> get_available_slots --> collect_user_info --+--> create_calendar_event --> send_sms_confirmation --+
-#                                                                             |                                         |           |
-#                                                                             | (missing info)                          |           v
-#                                                                             +--------------> generate_response <------+-----------+
-#                                                                                                           |
-#                                                                                                           +--> END
+#    (schedule_tour)              +--> get_available_slots --+
+# analyze_intent --> fork_booking |                          +--> join_booking --+--> create_calendar_event --> finalize_booking --> END
+#                                 +--> collect_user_info ----+                   |                                         |
+#                                                                                | (missing info)                         | (no event id)
+#                                                                                +--------------> generate_response <-----+
+#                                                                                                              |
+#                                                                                                              +--> END
 # -----------------------------------------------------------------------------
\ No newline at end of file
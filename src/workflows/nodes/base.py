@@ -3,8 +3,9 @@ Base Node Class with Common LangGraph Patterns
 """
 
 import logging
+import re
 from typing import Dict, Any, Callable
-from functools import wraps
+from functools import cache, cached_property, wraps
 import asyncio
 
 from src.workflows.state import WorkflowState
@@ -17,6 +18,46 @@ from src.visualization.workflow_visualizer import workflow_visualizer, NodeStatu
 logger = logging.getLogger(__name__)
 
 
+# Known names extractable from conversation history, matched in one compiled
+# pass instead of a per-field substring loop
+_NAME_RE = re.compile(r"\b(emtiaz|riad)\b")
+_NAME_CANON = {"emtiaz": "Emtiaz", "riad": "Riad"}
+_HISTORY_FIELDS = frozenset({"name", "user_name"})
+
+
+def _lower_history(state: WorkflowState) -> str:
+    """Lower the conversation history once per state; multi-field extraction
+    in the same request reuses the cached string"""
+    cached = state.get("_history_lower")
+    if cached is None:
+        cached = (state.get("conversation_history") or "").lower()
+        state["_history_lower"] = cached
+    return cached
+
+
+# The service clients are stateless apart from their connection pools, so all
+# node instances share one of each; per-instance construction rebuilt HTTP
+# sessions and auth setup for every node in every workflow build
+@cache
+def _shared_property_service() -> PropertyService:
+    return PropertyService()
+
+
+@cache
+def _shared_calendar_tool() -> CalendarTool:
+    return CalendarTool()
+
+
+@cache
+def _shared_sms_tool() -> SMSTool:
+    return SMSTool()
+
+
+@cache
+def _shared_openai_service() -> OpenAIService:
+    return OpenAIService()
+
+
 def error_handler(func: Callable) -> Callable:
     """LangGraph decorator for automatic error handling returning deltas"""
     @wraps(func)
@@ -29,40 +70,63 @@ def error_handler(func: Callable) -> Callable:
     return wrapper
 
 
+# Background tracking tasks held here until done so they are not garbage
+# collected mid-flight
+_tracking_tasks: set = set()
+
+
+def _track_in_background(coro) -> "asyncio.Task":
+    """Run a visualizer update concurrently with the node work instead of
+    stalling the workflow on observability I/O"""
+    task = asyncio.create_task(coro)
+    _tracking_tasks.add(task)
+    task.add_done_callback(_tracking_tasks.discard)
+    return task
+
+
 def track_workflow_execution(node_name: str):
     """Decorator to automatically track workflow execution in the visualizer"""
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(self, state: WorkflowState, config=None) -> Dict[str, Any]:
-            # Track node start
-            await workflow_visualizer.track_node_execution(
-                node_name, 
+            # Track node start off the critical path
+            running_task = _track_in_background(workflow_visualizer.track_node_execution(
+                node_name,
                 NodeStatus.RUNNING,
                 {"user_query": state.get("user_query", ""), "user_id": state.get("user_id", "")}
-            )
-            
+            ))
+
             try:
                 # Execute the node
                 result = await func(self, state, config)
-                
-                # Track successful completion
-                await workflow_visualizer.track_node_execution(
-                    node_name, 
+
+                # Track successful completion off the critical path
+                _track_in_background(workflow_visualizer.track_node_execution(
+                    node_name,
                     NodeStatus.COMPLETED,
                     output_data=result
-                )
-                
+                ))
+
                 return result
-                
+
             except Exception as e:
-                # Track error
+                # The RUNNING update may still be queued if the node failed
+                # before its first yield to the event loop; let it land first
+                # so the ERROR record below stays the node's final status
+                try:
+                    await running_task
+                except Exception:
+                    pass
+
+                # Track error; awaited so the failure record lands before the
+                # exception unwinds the workflow
                 await workflow_visualizer.track_node_execution(
-                    node_name, 
+                    node_name,
                     NodeStatus.ERROR,
                     error_message=str(e)
                 )
                 raise e
-                
+
         return wrapper
     return decorator
 
@@ -71,18 +135,31 @@ class BaseNode:
     """Base class for all LangGraph workflow nodes"""
     
     def __init__(self):
-        self.property_service = PropertyService()
-        self.calendar_tool = CalendarTool()
-        self.sms_tool = SMSTool()
-        self.openai_service = OpenAIService()
-        
         # Common field mappings
         self.user_info_fields = {
             "user_name": ["user_name", "name"],
-            "user_email": ["user_email", "email"], 
+            "user_email": ["user_email", "email"],
             "user_phone": ["user_name", "phone"],
             "user_pets": ["pets", "pet_policy"]
         }
+
+    # The shared clients resolve lazily so a node only touches the factories
+    # it actually uses; IntentAnalyzerNode construction triggers none of them
+    @cached_property
+    def property_service(self) -> PropertyService:
+        return _shared_property_service()
+
+    @cached_property
+    def calendar_tool(self) -> CalendarTool:
+        return _shared_calendar_tool()
+
+    @cached_property
+    def sms_tool(self) -> SMSTool:
+        return _shared_sms_tool()
+
+    @cached_property
+    def openai_service(self) -> OpenAIService:
+        return _shared_openai_service()
     
     def _create_fallback_context(self, fallback_type: str, details: Dict[str, Any]) -> Dict[str, Any]:
         """LangGraph pattern: Standardized fallback context creation"""
@@ -100,17 +177,8 @@ class BaseNode:
     
     def _extract_from_history(self, field: str, state: WorkflowState) -> str:
         """LangGraph pattern: History extraction with mapping"""
-        history = state.get("conversation_history", "").lower()
-        
-        # LangGraph pattern: Field extraction mapping
-        extraction_patterns = {
-            "name": {"emtiaz": "Emtiaz", "riad": "Riad"},
-            "user_name": {"emtiaz": "Emtiaz", "riad": "Riad"}
-        }
-        
-        patterns = extraction_patterns.get(field, {})
-        for pattern, value in patterns.items():
-            if pattern in history:
-                return value
-                
-        return None
\ No newline at end of file
+        if field not in _HISTORY_FIELDS:
+            return None
+
+        match = _NAME_RE.search(_lower_history(state))
+        return _NAME_CANON[match.group(1)] if match else None
\ No newline at end of file
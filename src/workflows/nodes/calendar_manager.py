@@ -10,6 +10,28 @@ from src.workflows.state import WorkflowState
 
 logger = logging.getLogger(__name__)
 
+# Scheduling constants shared by every booking: the timezone name the
+# Calendar API expects, the fixed next-day offset, the one-hour tour length
+# and the display format, none of which need rebuilding per event
+_TZ_NAME = 'America/Chicago'
+_APPT_OFFSET = timedelta(days=1, hours=11)
+_ONE_HOUR = timedelta(hours=1)
+_APPT_FMT = "%A, %B %d at %I:%M %p"
+
+# Event description hoisted to a pre-stripped constant so each booking does a
+# single format call instead of rebuilding and stripping the multiline literal
+_DESC_TEMPLATE = (
+    "Property Tour Appointment\n"
+    "\n"
+    "Client Details:\n"
+    "- Name: {user_name}\n"
+    "- Email: {user_email}\n"
+    "- Phone: {user_phone}\n"
+    "- Pets: {user_pets}\n"
+    "\n"
+    "Property: {property_address}"
+)
+
 
 class CalendarManagerNode(BaseNode):
     """Node for creating calendar events for appointments"""
@@ -17,7 +39,7 @@ class CalendarManagerNode(BaseNode):
     @error_handler
     async def create_calendar_event(self, state: WorkflowState, config=None) -> dict:
         """Create calendar event - LangGraph optimized"""
-        appointment_time = datetime.now() + timedelta(days=1, hours=11)
+        appointment_time = datetime.now() + _APPT_OFFSET
         property_address = self._get_property_address(state)
         
         # LangGraph pattern: Template-based event creation
@@ -30,7 +52,7 @@ class CalendarManagerNode(BaseNode):
                 "calendar_event_id": result.get("event_id"),
                 "appointment_details": {
                     "property_address": property_address,
-                    "formatted_date": appointment_time.strftime("%A, %B %d at %I:%M %p"),
+                    "formatted_date": appointment_time.strftime(_APPT_FMT),
                     "id": result.get("event_id")
                 }
             }
@@ -47,26 +69,23 @@ class CalendarManagerNode(BaseNode):
     
     def _build_calendar_event(self, state: WorkflowState, appointment_time: datetime, property_address: str) -> Dict[str, Any]:
         """LangGraph pattern: Template-based calendar event building"""
+        user_email = state.get('user_email')
         return {
             'summary': f'Property Tour - {property_address}',
-            'description': f"""
-Property Tour Appointment
-
-Client Details:
-- Name: {state.get('user_name', 'N/A')}
-- Email: {state.get('user_email', 'N/A')}
-- Phone: {state.get('user_phone', 'N/A')}
-- Pets: {state.get('user_pets', 'N/A')}
-
-Property: {property_address}
-            """.strip(),
+            'description': _DESC_TEMPLATE.format(
+                user_name=state.get('user_name', 'N/A'),
+                user_email=user_email or 'N/A',
+                user_phone=state.get('user_phone', 'N/A'),
+                user_pets=state.get('user_pets', 'N/A'),
+                property_address=property_address
+            ),
             'start': {
                 'dateTime': appointment_time.isoformat(),
-                'timeZone': 'America/Chicago',
+                'timeZone': _TZ_NAME,
             },
             'end': {
-                'dateTime': (appointment_time + timedelta(hours=1)).isoformat(),
-                'timeZone': 'America/Chicago',
+                'dateTime': (appointment_time + _ONE_HOUR).isoformat(),
+                'timeZone': _TZ_NAME,
             },
-            'attendees': [{'email': state.get('user_email', '')}] if state.get('user_email') else [],
+            'attendees': [{'email': user_email}] if user_email else [],
         }
\ No newline at end of file
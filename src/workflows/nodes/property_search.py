@@ -2,17 +2,158 @@
 LangGraph Property Search Node - Simplified property search
 """
 
+import asyncio
+import hashlib
 import logging
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from .base import BaseNode, error_handler, track_workflow_execution
 from src.workflows.state import WorkflowState
 
 logger = logging.getLogger(__name__)
 
+# Keyword screens compiled once at import: each check is a single linear
+# regex pass instead of a Python loop of per-keyword substring scans
+_NON_PROPERTY_RE = re.compile(
+    r'\b(?:tshirt|t-shirt|shirt|jeans|makeup|lipstick|iphone|android|laptop'
+    r'|macbook|headphones|earbuds|charger|grocery|groceries|fruits|vegetables'
+    r'|milk|perfume|shampoo|soap|toothpaste|toys|gaming|electronics|camera'
+    r'|television|tv)\b'
+)
+_PROPERTY_KEYWORDS_RE = re.compile(
+    r'\b(?:bed|beds|bedroom|br|studio|apartment|house|condo|rental|rent|lease|property)\b'
+)
+_BED_NUM_RE = re.compile(r'\b(\d+)\s*(?:bed|beds|bedroom|bedrooms|br)\b')
+_TX_CITY_RE = re.compile(r'\b(?:houston|dallas|austin|san antonio)\b')
+
+# LRU bound for memoized criteria extractions
+_MAX_EXTRACT_CACHE = 128
+
+@lru_cache(maxsize=256)
+def _clarification_prompt(query: str) -> str:
+    """Get targeted clarification prompt based on query content. Memoized at
+    module level (lru_cache on an instance method would pin the node object):
+    reflection loop-backs resubmit the same query, so repeats are a dict hit
+    instead of five substring scans"""
+    q = query.lower()
+
+    if "pet" in q:
+        return "Do you have cats, dogs, both, or no pets?"
+    elif "bed" in q:
+        return "How many bedrooms do you need: 1, 2, 3, or 4+?"
+    elif "location" in q or "area" in q or "city" in q:
+        return "Which city or neighborhood are you looking in?"
+    elif "budget" in q or "price" in q or "rent" in q:
+        return "What's your monthly budget range?"
+    else:
+        return "Could you tell me your preferred location, budget, and number of bedrooms?"
+
+
+def _present(v) -> bool:
+    """Whether a criteria value is meaningful. The previous
+    `v not in (None, "", [], {})` form ran container equality against empty
+    list/dict literals on every check; this short-circuits on identity and
+    truthiness instead"""
+    return v is not None and v != "" and not (isinstance(v, (list, dict)) and not v)
+
+
+# Criteria presence is tracked as a bitmask: one loop over the merged
+# criteria sets the bits, and the guardrail / clarification checks below
+# test bits instead of re-scanning the dict per question
+_ADDRESS, _BEDROOMS, _BUDGET, _PETS, _DATE, _OTHER = 1, 2, 4, 8, 16, 32
+_FIELD_MASK = {
+    "address": _ADDRESS,
+    "bedrooms": _BEDROOMS,
+    "rent_min": _BUDGET,
+    "rent_max": _BUDGET,
+    "rent_exact": _BUDGET,
+    "pets": _PETS,
+    "available_date": _DATE,
+}
+_KNOWN_FIELDS = _ADDRESS | _BEDROOMS | _BUDGET | _PETS | _DATE
+
+# Clarification prompts in ask-first priority order, keyed by the missing bit
+_PRIORITY_PROMPTS = (
+    (_ADDRESS, "Which city or area are you looking for? I have properties in Austin, Dallas, Houston, San Antonio, and Fort Worth."),
+    (_BEDROOMS, "How many bedrooms do you need?"),
+    (_BUDGET, "What's your monthly budget range?"),
+    (_PETS, "Do you have any pets I should know about?"),
+)
+
+# Immutable fallback-detail constants: referenced, never re-allocated per call
+_TX_SUGGESTED_AREAS = ("Houston", "Dallas", "Austin", "San Antonio")
+_STD_MISSING = ("location", "budget", "bedrooms", "pets", "available date")
+_NON_PROPERTY_MSG = "I can help with Texas home rentals: city, budget, bedrooms, pets, move-in date."
+
+
+def _fb(type_: str, **details) -> Dict[str, Any]:
+    """Assemble a fallback_context from keyword details"""
+    return {"type": type_, "details": details}
+
+
+# Response-schema key order for formatted properties
+_PROP_KEYS = ("id", "address", "bedrooms", "rent", "available", "pets")
+
+
+def _format_property(prop: Dict[str, Any], _keys=_PROP_KEYS,
+                     _str=str, _int=int, _float=float) -> Dict[str, Any]:
+    """Format one property for schema compliance; callers filter out special
+    suggestion objects before formatting. The built-in casts are bound as
+    defaults so the per-property loop does local loads instead of global
+    lookups"""
+    return dict(zip(_keys, (
+        _str(prop["id"]),
+        _str(prop["address"]),
+        _int(prop["bedrooms"]),
+        _float(prop["rent"]),
+        _str(prop.get("available", True)),
+        _str(prop["pets"]),
+    )))
+
+
+def search_fingerprint(query: str, filters: Optional[Dict[str, Any]]) -> str:
+    """Stable fingerprint of a (query, filters) search input pair.
+
+    Shared with the chat endpoint, which seeds the previous turn's results
+    back into state when the incoming inputs produce the same fingerprint;
+    hashlib keeps it stable across processes, unlike hash()."""
+    canonical = (query or "",
+                 tuple(sorted((k, repr(v)) for k, v in (filters or {}).items())))
+    return hashlib.md5(repr(canonical).encode()).hexdigest()
+
+
+def _has_property_hints(text: str) -> bool:
+    """Whether this turn mentions housing or bedroom terms at all"""
+    t = (text or "").lower().strip()
+    if not t:
+        return False
+    return bool(_PROPERTY_KEYWORDS_RE.search(t) or _BED_NUM_RE.search(t))
+
 
 class PropertySearchNode(BaseNode):
     """LangGraph node for property search"""
-    
+
+    def __init__(self):
+        super().__init__()
+        # Criteria extractions memoized per query: a reflection loop-back
+        # resubmits the same user_query and would otherwise pay the LLM
+        # round-trip a second time
+        self._extract_cache: OrderedDict = OrderedDict()
+
+    async def _extract_criteria_cached(self, user_query: str) -> Dict[str, Any]:
+        cached = self._extract_cache.get(user_query)
+        if cached is not None:
+            self._extract_cache.move_to_end(user_query)
+            return dict(cached)
+
+        extracted = await self.property_service.extract_search_criteria(user_query)
+        self._extract_cache[user_query] = extracted or {}
+        if len(self._extract_cache) > _MAX_EXTRACT_CACHE:
+            self._extract_cache.popitem(last=False)
+        return extracted
+
     @error_handler
     @track_workflow_execution("search_properties")
     async def search_properties(self, state: WorkflowState, config=None) -> dict:
@@ -20,59 +161,59 @@ class PropertySearchNode(BaseNode):
         
         user_query = state.get("user_query", "")
         logger.info(f"Searching properties for query: {user_query}")
-        
-        # Extract search criteria for this turn
-        extracted = await self.property_service.extract_search_criteria(user_query)
 
-        # Merge with prior criteria across turns
         prior: Dict[str, Any] = state.get("search_filters") or {}
+
+        # Delta check: a turn that repeats the previous query against the same
+        # filters would re-run the whole extraction -> search pipeline for
+        # identical inputs. The chat endpoint seeds _last_search_fp and the
+        # prior results from the session when the incoming inputs match the
+        # last completed search, so the skip works across requests.
+        fp = search_fingerprint(user_query, prior)
+        if state.get("_last_search_fp") == fp and state.get("properties"):
+            logger.info("Search inputs unchanged; reusing previous results")
+            return state
+
+        # Extract search criteria for this turn (cached across reflection loops)
+        extracted = await self._extract_criteria_cached(user_query)
+
+        # Merge with prior criteria across turns
         criteria: Dict[str, Any] = {**prior}
         for k, v in (extracted or {}).items():
-            if v not in (None, "", [], {}):
+            if _present(v):
                 criteria[k] = v
 
         # If this turn contains no property hints and extraction found nothing, avoid using stale filters
-        def _has_property_hints(text: str) -> bool:
-            t = (text or "").lower().strip()
-            if not t:
-                return False
-            bedroom_keywords = ["bed", "beds", "bedroom", "br", "studio"]
-            housing_keywords = ["apartment", "house", "condo", "rental", "rent", "lease", "property"]
-            has_keywords = any(k in t for k in bedroom_keywords + housing_keywords)
-            import re
-            has_bed_num = bool(re.search(r"\b(\d+)\s*(bed|beds|bedroom|bedrooms|br)\b", t))
-            return has_keywords or has_bed_num
-
-        non_null_extracted = [k for k, v in (extracted or {}).items() if v not in (None, "", [], {})]
+        non_null_extracted = [k for k, v in (extracted or {}).items() if _present(v)]
         if not non_null_extracted and not _has_property_hints(user_query):
             # Reset filters for this turn and ask for criteria instead of returning default results
             state.update({
                 "properties": [],
                 "search_filters": {},
-                "fallback_context": {
-                    "type": "need_criteria",
-                    "details": {
-                        "missing": ["location", "budget", "bedrooms", "pets", "available date"],
-                        "clarify_prompt": self._get_clarification_prompt(user_query)
-                    }
-                }
+                "fallback_context": _fb(
+                    "need_criteria",
+                    missing=_STD_MISSING,
+                    clarify_prompt=_clarification_prompt(user_query)
+                )
             })
             return state
 
+        # One pass over the merged criteria records which fields are present
+        present = 0
+        for k, v in criteria.items():
+            if _present(v):
+                present |= _FIELD_MASK.get(k, _OTHER)
+
         # Guardrail: non-property heuristic (quick keyword screen)
-        if self._looks_non_property(user_query) and not any(
-            criteria.get(k) for k in ["address", "bedrooms", "rent_min", "rent_max", "rent_exact", "pets", "available_date"]
-        ):
+        if self._looks_non_property(user_query) and not present & _KNOWN_FIELDS:
             state.update({
                 "properties": [],
                 "search_filters": criteria,
-                "fallback_context": {
-                    "type": "general_failure",
-                    "details": {
-                        "reason": "non_property",
-                        "message": "I can help with Texas home rentals: city, budget, bedrooms, pets, move-in date."
-                    }
-                }
+                "fallback_context": _fb(
+                    "general_failure",
+                    reason="non_property",
+                    message=_NON_PROPERTY_MSG
+                )
             })
             return state
 
@@ -83,142 +224,90 @@ class PropertySearchNode(BaseNode):
             state.update({
                 "properties": [],
                 "search_filters": criteria,
-                "fallback_context": {
-                    "type": "no_properties",
-                    "details": {
-                        "query": user_query,
-                        "filters": criteria,
-                        "suggested_areas": ["Houston", "Dallas", "Austin", "San Antonio"],
-                        "original_location": original_location_input
-                    }
-                }
+                "fallback_context": _fb(
+                    "no_properties",
+                    query=user_query,
+                    filters=criteria,
+                    suggested_areas=_TX_SUGGESTED_AREAS,
+                    original_location=original_location_input
+                )
             })
             return state
         
-        # Counter-question strategy: prioritize missing info in strict order
-        missing_order = ["address", "bedrooms", "rent_min/rent_max/rent_exact", "pets"]
-        def _has_budget(c: Dict[str, Any]) -> bool:
-            return any(c.get(k) not in (None, "", [], {}) for k in ["rent_min", "rent_max", "rent_exact"])
-        missing_fields = []
-        if not criteria.get("address"):
-            missing_fields.append("location")
-        if not criteria.get("bedrooms"):
-            missing_fields.append("bedrooms")
-        if not _has_budget(criteria):
-            missing_fields.append("budget")
-        # Ask about pets only if pets were mentioned or we already have other strong filters
+        # Counter-question strategy: ask about pets only if pets were
+        # mentioned or we already have other strong filters
         ql = (user_query or "").lower()
-        pets_hint = ("pet" in ql) or bool(criteria.get("address") or criteria.get("bedrooms") or _has_budget(criteria))
-        if not criteria.get("pets") and pets_hint:
-            missing_fields.append("pets")
+        pets_hint = ("pet" in ql) or bool(present & (_ADDRESS | _BEDROOMS | _BUDGET))
 
         # If we have no meaningful criteria at all, ask for the highest-priority one
-        meaningful_fields = [k for k, v in (criteria or {}).items() if v not in (None, "", [], {})]
-        if not meaningful_fields:
+        if not present:
             prompt_by_priority = None
-            if not criteria.get("address"):
-                prompt_by_priority = "Which city or area are you looking for? I have properties in Austin, Dallas, Houston, San Antonio, and Fort Worth."
-            elif not criteria.get("bedrooms"):
-                prompt_by_priority = "How many bedrooms do you need?"
-            elif not _has_budget(criteria):
-                prompt_by_priority = "What's your monthly budget range?"
-            elif not criteria.get("pets") and pets_hint:
-                prompt_by_priority = "Do you have any pets I should know about?"
+            for bit, prompt in _PRIORITY_PROMPTS:
+                if not present & bit and (bit != _PETS or pets_hint):
+                    prompt_by_priority = prompt
+                    break
 
             state.update({
                 "properties": [],
                 "search_filters": criteria,
-                "fallback_context": {
-                    "type": "need_criteria",
-                    "details": {
-                        "missing": ["location", "budget", "bedrooms", "pets", "available date"],
-                        "clarify_prompt": prompt_by_priority or self._get_clarification_prompt(user_query)
-                    }
-                }
+                "fallback_context": _fb(
+                    "need_criteria",
+                    missing=_STD_MISSING,
+                    clarify_prompt=prompt_by_priority or _clarification_prompt(user_query)
+                )
             })
             return state
         
         # Search with merged criteria
         properties = self.property_service.search_with_criteria(criteria)
         
-        # Update state with results
-        formatted_props = [self._format_property(p) for p in properties]
-        # Filter out special suggestion objects from properties list to satisfy response schema
-        clean_props = [p for p in formatted_props if not p.get("_no_exact_match")]
+        # Update state with results: format, drop special suggestion objects
+        # (to satisfy the response schema) and capture their message in one pass
+        clean_props = []
+        special_msg = None
+        for p in properties:
+            if p.get("_no_exact_match"):
+                if special_msg is None:
+                    special_msg = str(p.get("_suggestion_message", ""))
+                continue
+            clean_props.append(_format_property(p))
         state.update({
             "properties": clean_props,
             "search_filters": criteria
         })
+
+        # No results and refinement-hint cases assemble the same fallback;
+        # only the suggestions payload differs (the suggestion-object message
+        # wins over tailored suggestions). Area suggestions are fetched off
+        # the event loop since the lookup scans the property catalog.
+        if not clean_props or special_msg:
+            suggested_areas = await asyncio.to_thread(
+                self.property_service.suggest_areas, criteria.get("address"))
+            state["fallback_context"] = _fb(
+                "no_properties",
+                query=user_query,
+                filters=criteria,
+                suggested_areas=suggested_areas,
+                original_location=original_location_input,
+                suggestions={"budget": special_msg} if special_msg
+                else self._tailored_suggestions(criteria)
+            )
         
-        # Handle no results with tailored suggestions
-        if not clean_props:
-            suggestions = self._tailored_suggestions(criteria)
-            suggested_areas = self.property_service.suggest_areas(criteria.get("address"))
-            state["fallback_context"] = {
-                "type": "no_properties",
-                "details": {
-                    "query": user_query,
-                    "filters": criteria,
-                    "suggested_areas": suggested_areas,
-                    "original_location": original_location_input,
-                    "suggestions": suggestions
-                }
-            }
-        else:
-            # If we had special suggestion objects originally, surface their message as a refinement hint
-            special_msg = None
-            for p in formatted_props:
-                if p.get("_no_exact_match"):
-                    special_msg = p.get("_suggestion_message")
-                    break
-            if special_msg:
-                state["fallback_context"] = {
-                    "type": "no_properties",
-                    "details": {
-                        "query": user_query,
-                        "filters": criteria,
-                        "suggested_areas": self.property_service.suggest_areas(criteria.get("address")),
-                        "original_location": original_location_input,
-                        "suggestions": {"budget": special_msg}
-                    }
-                }
-        
+        # Recorded against the merged criteria, because those are what the
+        # next turn carries back in as its prior filters
+        state["_last_search_fp"] = search_fingerprint(user_query, criteria)
         logger.info(f"Found {len(properties)} properties")
         return state
     
-    def _get_clarification_prompt(self, query: str) -> str:
-        """Get targeted clarification prompt based on query content"""
-        q = query.lower()
-        
-        if "pet" in q:
-            return "Do you have cats, dogs, both, or no pets?"
-        elif "bed" in q:
-            return "How many bedrooms do you need: 1, 2, 3, or 4+?"
-        elif "location" in q or "area" in q or "city" in q:
-            return "Which city or neighborhood are you looking in?"
-        elif "budget" in q or "price" in q or "rent" in q:
-            return "What's your monthly budget range?"
-        else:
-            return "Could you tell me your preferred location, budget, and number of bedrooms?"
-
     def _looks_non_property(self, q: str) -> bool:
-        ql = (q or "").lower()
-        non_property_keywords = [
-            "tshirt", "t-shirt", "shirt", "jeans", "makeup", "lipstick", "iphone", "android", "laptop",
-            "macbook", "headphones", "earbuds", "charger", "grocery", "groceries", "fruits", "vegetables",
-            "milk", "perfume", "shampoo", "soap", "toothpaste", "toys", "gaming", "electronics", "camera",
-            "television", "tv"
-        ]
-        return any(k in ql for k in non_property_keywords)
+        return bool(_NON_PROPERTY_RE.search((q or "").lower()))
 
     def _enforce_texas_only(self, criteria: Dict[str, Any]) -> (Dict[str, Any], bool):
         address = str(criteria.get("address") or "").strip()
         if not address:
             return criteria, False
-        allowed = {"houston", "dallas", "austin", "san antonio"}
         # If address contains a known Texas city name, allow
-        lower_addr = address.lower()
-        if any(city in lower_addr for city in allowed):
+        if _TX_CITY_RE.search(address.lower()):
             return criteria, False
         # Otherwise, redirect to Texas-only options
         # Clear non-Texas location to avoid futile searches
@@ -239,8 +328,11 @@ class PropertySearchNode(BaseNode):
         if criteria.get("bedrooms"):
             try:
                 br = int(criteria.get("bedrooms"))
-                alt = " or ".join([v for v in {br-1, br+1, max(1, br-2)} if isinstance(v, int) and v > 0])
-                if alt:
+                # dict.fromkeys dedupes while keeping candidate order; the
+                # candidates are always ints so no isinstance filtering needed
+                cands = [v for v in dict.fromkeys((br - 1, br + 1, max(1, br - 2))) if v > 0 and v != br]
+                if cands:
+                    alt = " or ".join(map(str, cands))
                     suggestions["bedrooms"] = f"No {br}-bed listings match. Would you consider {alt} bedrooms?"
             except Exception:
                 suggestions["bedrooms"] = "No exact bedroom match. Consider nearby bedroom counts."
@@ -255,20 +347,3 @@ class PropertySearchNode(BaseNode):
         if not suggestions:
             suggestions["general"] = "No exact matches. Try adjusting city, budget, bedrooms, or pet policy."
         return suggestions
-    
-    def _format_property(self, prop: Dict[str, Any]) -> Dict[str, Any]:
-        """Format property for schema compliance"""
-        # Pass-through special suggestion objects (no exact match scenarios)
-        if prop.get("_no_exact_match"):
-            return {
-                "_no_exact_match": True,
-                "_suggestion_message": str(prop.get("_suggestion_message", ""))
-            }
-        return {
-            "id": str(prop["id"]),
-            "address": str(prop["address"]),
-            "bedrooms": int(prop["bedrooms"]),
-            "rent": float(prop["rent"]),
-            "available": str(prop.get("available", True)),
-            "pets": str(prop["pets"])
-        }
\ No newline at end of file
@@ -33,8 +33,10 @@ class ReflectionNode(BaseNode):
         # Simple heuristic: if no properties, or vague intent, request another search
         needs_more = len(properties) == 0
 
-        loops_allowed = getattr(config, "max_research_loops", 1) if config else 1
-        current_loops = int(state.get("reflection_loops", 0) or 0)
+        # reflection_loops is only ever written as an int below, so no int()
+        # coercion; getattr's default already covers config being None
+        loops_allowed = getattr(config, "max_research_loops", 1)
+        current_loops = state.get("reflection_loops") or 0
 
         if needs_more and current_loops < loops_allowed:
             notes = "Insufficient results. Try refining search."
@@ -9,6 +9,31 @@ from src.workflows.state import WorkflowState
 
 logger = logging.getLogger(__name__)
 
+# Extraction patterns compiled once at import; the per-call re.search form
+# rebuilt the pattern lists and paid a cache-key lookup per pattern on every
+# info-collection turn
+_NAME_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"my name is ([a-zA-Z\s]+)",
+    r"i'm ([a-zA-Z\s]+)",
+    r"i am ([a-zA-Z\s]+)",
+    r"name:\s*([a-zA-Z\s]+)",
+))
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = tuple(re.compile(p) for p in (
+    r'(\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4})',
+    r'(\d{10})',
+    r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})',
+))
+# The phone patterns above only ever match digits, '+' and the separators
+# ' -.()' — deleting the separators with a translate table is a single
+# C-level pass instead of a regex substitution
+_PHONE_STRIP = str.maketrans('', '', ' -.()')
+_PETS_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"i have (no pets|no pet|cats?|dogs?|cats? and dogs?)",
+    r"pets?:\s*(no|none|cats?|dogs?|cats? and dogs?)",
+    r"(no pets|cats?|dogs?|cats? and dogs?)",
+))
+
 
 class UserInfoCollectorNode(BaseNode):
     """Node for collecting user information for booking"""
@@ -61,55 +86,35 @@ class UserInfoCollectorNode(BaseNode):
     def _extract_user_info(self, user_query: str, existing_info: dict) -> dict:
         """Extract user information from natural language input"""
         extracted = {}
-        
+
         # Extract name
-        name_patterns = [
-            r"my name is ([a-zA-Z\s]+)",
-            r"i'm ([a-zA-Z\s]+)",
-            r"i am ([a-zA-Z\s]+)",
-            r"name:\s*([a-zA-Z\s]+)",
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, user_query, re.IGNORECASE)
+        for pattern in _NAME_RES:
+            match = pattern.search(user_query)
             if match:
                 extracted["name"] = match.group(1).strip().title()
                 break
-        
+
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, user_query)
+        email_match = _EMAIL_RE.search(user_query)
         if email_match:
             extracted["email"] = email_match.group(0).lower()
-        
+
         # Extract phone
-        phone_patterns = [
-            r'(\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4})',
-            r'(\d{10})',
-            r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, user_query)
+        for pattern in _PHONE_RES:
+            match = pattern.search(user_query)
             if match:
                 # Clean up phone number
-                phone = re.sub(r'[^\d+]', '', match.group(1))
+                phone = match.group(1).translate(_PHONE_STRIP)
                 if len(phone) == 10:
                     phone = f"+1{phone}"
                 elif len(phone) == 11 and phone.startswith('1'):
                     phone = f"+{phone}"
                 extracted["phone"] = phone
                 break
-        
+
         # Extract pets info
-        pets_patterns = [
-            r"i have (no pets|no pet|cats?|dogs?|cats? and dogs?)",
-            r"pets?:\s*(no|none|cats?|dogs?|cats? and dogs?)",
-            r"(no pets|cats?|dogs?|cats? and dogs?)"
-        ]
-        
-        for pattern in pets_patterns:
-            match = re.search(pattern, user_query, re.IGNORECASE)
+        for pattern in _PETS_RES:
+            match = pattern.search(user_query)
             if match:
                 pets_text = match.group(1).lower()
                 if "no" in pets_text or "none" in pets_text:
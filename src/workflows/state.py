@@ -3,7 +3,15 @@ Workflow State Management for LangGraph
 """
 
 from typing import Dict, Any, List, Optional
-from typing_extensions import TypedDict
+from typing_extensions import Annotated, TypedDict
+
+
+def merge_errors(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """Reducer for the error channel: parallel booking branches may both fail
+    in the same superstep, so their messages are joined deterministically"""
+    if left and right and left != right:
+        return f"{left}; {right}"
+    return right or left
 
 
 class WorkflowState(TypedDict):
@@ -23,6 +31,10 @@ class WorkflowState(TypedDict):
     # Property search results
     properties: List[Dict[str, Any]]
     search_filters: Dict[str, Any]
+    # Fingerprint of the last completed (query, filters) search, persisted in
+    # the search session and seeded back in by the chat endpoint; lets
+    # search_properties skip re-running on unchanged inputs
+    _last_search_fp: Optional[str]
     search_query: Optional[str]
     queries: List[str]
     reflection_notes: Optional[str]
@@ -50,7 +62,7 @@ class WorkflowState(TypedDict):
     suggested_actions: List[str]
     
     # Error handling
-    error: Optional[str]
+    error: Annotated[Optional[str], merge_errors]
     
     # Workflow control
     next_step: Optional[str]
@@ -2,6 +2,8 @@
 LangGraph Workflow Nodes - Modular Structure with Visualization Tracking
 """
 
+import asyncio
+
 from .nodes.intent_analyzer import IntentAnalyzerNode
 from .nodes.property_search import PropertySearchNode
 from .nodes.appointment_scheduler import AppointmentSchedulerNode
@@ -15,18 +17,20 @@ from src.visualization.node_wrapper import track_node_execution
 
 class WorkflowNodes:
     """Modular LangGraph workflow nodes using separate node classes"""
-    
-    def __init__(self):
-        # Initialize all node instances
-        self.intent_analyzer = IntentAnalyzerNode()
-        self.property_search = PropertySearchNode()
-        self.appointment_scheduler = AppointmentSchedulerNode()
-        self.user_info_collector = UserInfoCollectorNode()
-        self.calendar_manager = CalendarManagerNode()
-        self.sms_sender = SMSSenderNode()
-        self.response_generator = ResponseGeneratorNode()
-        self.reflection = ReflectionNode()
-    
+
+    # The node objects carry no per-request state (service clients are shared
+    # and lazy), so they live on the class: rebuilding WorkflowNodes
+    # re-allocates nothing and per-node setup work runs once per process
+    intent_analyzer = IntentAnalyzerNode()
+    property_search = PropertySearchNode()
+    appointment_scheduler = AppointmentSchedulerNode()
+    user_info_collector = UserInfoCollectorNode()
+    calendar_manager = CalendarManagerNode()
+    sms_sender = SMSSenderNode()
+    response_generator = ResponseGeneratorNode()
+    reflection = ReflectionNode()
+
+
     # Delegate methods to appropriate node instances with visualization tracking
     @track_node_execution("analyze_intent")
     async def analyze_intent(self, state, config=None):
@@ -58,4 +62,13 @@ class WorkflowNodes:
 
     @track_node_execution("reflect")
     async def reflect(self, state, config=None):
-        return await self.reflection.reflect(state, config)
\ No newline at end of file
+        return await self.reflection.reflect(state, config)
+
+    async def finalize_booking(self, state, config=None):
+        """Post-booking fanout: the SMS confirmation and the final response
+        are independent I/O once the event is booked, so they overlap in one
+        wall-clock window instead of running back to back"""
+        sms_task = asyncio.create_task(self.send_sms_confirmation(state, config))
+        response_updates = await self.generate_response(state, config)
+        sms_updates = await sms_task
+        return {**sms_updates, **response_updates}
\ No newline at end of file
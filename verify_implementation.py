@@ -3,245 +3,272 @@
 Comprehensive verification of LangGraph PropertyTek implementation
 """
 
+import io
 import sys
 import os
-import json
-from typing import Dict, Any
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Add the src directory to the path once; an unconditional append pushed a
+# duplicate entry on every reload, lengthening every later sys.path walk
+_SRC = os.path.join(os.path.dirname(__file__), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
-def test_workflow_state():
-    """Test WorkflowState functionality"""
-    print("🧪 Testing WorkflowState...")
-    
-    try:
-        from src.workflows.state import WorkflowState
-        
-        # Create a test state
-        test_state: WorkflowState = {
-            "user_query": "Show me 2 bedroom apartments in Austin",
-            "user_id": "test_user_123",
-            "conversation_history": None,
-            "intent": "property_search",
-            "entities": {"bedrooms": 2, "city": "Austin"},
-            "confidence": "high",
-            "properties": [],
-            "search_filters": {},
-            "available_slots": [],
-            "selected_slot": None,
-            "appointment_details": None,
-            "user_name": None,
-            "user_email": None,
-            "user_phone": None,
-            "user_pets": None,
-            "calendar_event_id": None,
-            "sms_sent": None,
-            "sms_result": None,
-            "response_message": "",
-            "suggested_actions": [],
-            "error": None,
-            "next_step": "search_properties",
-            "workflow_complete": False
-        }
-        
-        # Verify state structure
-        assert test_state["user_query"] == "Show me 2 bedroom apartments in Austin"
-        assert test_state["intent"] == "property_search"
-        assert test_state["entities"]["bedrooms"] == 2
-        assert test_state["next_step"] == "search_properties"
-        
-        print("✅ WorkflowState structure and functionality verified")
-        return True
-        
-    except Exception as e:
-        print(f"❌ WorkflowState test failed: {e}")
-        return False
+import importlib.util
+from importlib import import_module
 
 
-def test_openai_service():
-    """Test OpenAI service structure"""
-    print("🧪 Testing OpenAI Service...")
-    
-    try:
-        from src.services.openai_service import OpenAIService
-        
-        # Test service initialization (without actual API calls)
-        service = OpenAIService()
-        
-        # Verify methods exist
-        assert hasattr(service, 'analyze_intent')
-        assert hasattr(service, 'generate_response')
-        assert hasattr(service, 'client')
-        
-        print("✅ OpenAI Service structure verified")
-        return True
-        
-    except Exception as e:
-        print(f"❌ OpenAI Service test failed: {e}")
-        return False
+def cached_import(module_name: str, item_name: str):
+    """Resolve one attribute from a module, peeking sys.modules directly so
+    an already-loaded module costs a dict get + getattr instead of a full
+    trip through the import machinery (Django's cached_import pattern)"""
+    mod = sys.modules.get(module_name)
+    if mod is None or (
+        getattr(mod, '__spec__', None) is not None
+        and getattr(mod.__spec__, '_initializing', False) is not False
+    ):
+        mod = import_module(module_name)
+    return getattr(mod, item_name)
 
 
-def test_workflow_nodes():
-    """Test WorkflowNodes structure"""
-    print("🧪 Testing Workflow Nodes...")
-    
-    try:
-        from src.workflows.nodes import WorkflowNodes
-        
-        # Test nodes initialization (without actual service calls)
-        nodes = WorkflowNodes()
-        
-        # Verify all required methods exist
-        required_methods = [
-            'analyze_intent',
-            'search_properties', 
-            'get_available_slots',
-            'collect_user_info',
-            'create_calendar_event',
-            'send_sms_confirmation',
-            'generate_response'
-        ]
-        
-        for method in required_methods:
-            assert hasattr(nodes, method), f"Missing method: {method}"
-        
-        print("✅ Workflow Nodes structure verified")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Workflow Nodes test failed: {e}")
-        return False
+# All imports run once at process start instead of once per test call;
+# failures are recorded under the key each test checks, so each test can
+# report its own missing dependency and the others still run
+_IMPORT_ERRORS: dict = {}
 
+# The fourth column names the heaviest third-party dependency each module
+# pulls in; a cheap find_spec check short-circuits before the import chain
+# (FastAPI/Starlette, the OpenAI client, Google API client) starts loading
+_IMPORT_TABLE = (
+    ('WorkflowState', 'src.workflows.state', ('WorkflowState',), None),
+    ('OpenAIService', 'src.services.openai_service', ('OpenAIService',), 'openai'),
+    ('WorkflowNodes', 'src.workflows.nodes', ('WorkflowNodes',), 'openai'),
+    ('langgraph_api', 'src.chatbot.langgraph_api', ('app', 'ChatRequest', 'ChatResponse'), 'fastapi'),
+    ('PropertyService', 'src.services.property_service', ('PropertyService',), 'openai'),
+    ('tools', 'src.tools.calendar_tool', ('CalendarTool',), 'googleapiclient'),
+    ('tools', 'src.tools.sms_tool', ('SMSTool',), 'twilio'),
+)
 
-def test_langgraph_api():
-    """Test LangGraph API structure"""
-    print("🧪 Testing LangGraph API...")
-    
+for _key, _module, _names, _dep in _IMPORT_TABLE:
+    if _key in _IMPORT_ERRORS:
+        continue
+    if _dep is not None and importlib.util.find_spec(_dep) is None:
+        _IMPORT_ERRORS[_key] = ModuleNotFoundError(f"No module named '{_dep}'")
+        continue
     try:
-        from src.chatbot.langgraph_api import app, ChatRequest, ChatResponse
-        
-        # Test FastAPI app exists
-        assert app is not None
-        
-        # Test request/response models
-        test_request = ChatRequest(
-            query="test query",
-            user_id="test_user",
-            conversation_history=None
-        )
-        
-        assert test_request.query == "test query"
-        assert test_request.user_id == "test_user"
-        
-        print("✅ LangGraph API structure verified")
-        return True
-        
+        for _name in _names:
+            globals()[_name] = cached_import(_module, _name)
     except Exception as e:
-        print(f"❌ LangGraph API test failed: {e}")
-        return False
+        _IMPORT_ERRORS[_key] = e
 
 
-def test_property_service():
-    """Test Property Service integration"""
-    print("🧪 Testing Property Service...")
-    
-    try:
-        from src.services.property_service import PropertyService
-        
-        # Test service initialization
-        service = PropertyService()
-        
-        # Verify methods exist
-        assert hasattr(service, 'search_properties')
-        assert hasattr(service, 'get_all_properties')
-        
-        print("✅ Property Service integration verified")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Property Service test failed: {e}")
-        return False
+# Built once at module scope: repeated verification runs shallow-copy this
+# instead of re-executing the 23-key dict literal per call
+_REFERENCE_STATE = {
+    "user_query": "Show me 2 bedroom apartments in Austin",
+    "user_id": "test_user_123",
+    "conversation_history": None,
+    "intent": "property_search",
+    "entities": {"bedrooms": 2, "city": "Austin"},
+    "confidence": "high",
+    "properties": [],
+    "search_filters": {},
+    "available_slots": [],
+    "selected_slot": None,
+    "appointment_details": None,
+    "user_name": None,
+    "user_email": None,
+    "user_phone": None,
+    "user_pets": None,
+    "calendar_event_id": None,
+    "sms_sent": None,
+    "sms_result": None,
+    "response_message": "",
+    "suggested_actions": [],
+    "error": None,
+    "next_step": "search_properties",
+    "workflow_complete": False
+}
 
 
-def test_tools_integration():
-    """Test Calendar and SMS tools integration"""
-    print("🧪 Testing Tools Integration...")
-    
+def _check_workflow_state():
+    """Structure assertions beyond attribute presence for WorkflowState"""
+    test_state: WorkflowState = _REFERENCE_STATE.copy()
+
+    assert test_state["user_query"] == "Show me 2 bedroom apartments in Austin"
+    assert test_state["intent"] == "property_search"
+    assert test_state["entities"]["bedrooms"] == 2
+    assert test_state["next_step"] == "search_properties"
+
+
+def _check_langgraph_api():
+    """Structure assertions for the FastAPI app and request model"""
+    assert app is not None
+
+    test_request = ChatRequest(
+        query="test query",
+        user_id="test_user",
+        conversation_history=None
+    )
+
+    assert test_request.query == "test query"
+    assert test_request.user_id == "test_user"
+
+
+# One spec per test: targets are (constructor, required attrs) pairs checked
+# via a dir() set difference; extra carries the assertions that aren't pure
+# attribute presence. The six near-identical test functions collapsed into
+# this table plus the single runner below.
+TestSpec = namedtuple('TestSpec', 'name key targets extra success')
+
+_SPECS = (
+    TestSpec('WorkflowState', 'WorkflowState', (), _check_workflow_state,
+             "WorkflowState structure and functionality verified"),
+    TestSpec('OpenAI Service', 'OpenAIService',
+             ((lambda: OpenAIService(), ('analyze_intent', 'generate_response', 'client')),),
+             None, "OpenAI Service structure verified"),
+    TestSpec('Workflow Nodes', 'WorkflowNodes',
+             ((lambda: WorkflowNodes(), ('analyze_intent', 'search_properties',
+                                         'get_available_slots', 'collect_user_info',
+                                         'create_calendar_event', 'send_sms_confirmation',
+                                         'generate_response')),),
+             None, "Workflow Nodes structure verified"),
+    TestSpec('LangGraph API', 'langgraph_api', (), _check_langgraph_api,
+             "LangGraph API structure verified"),
+    TestSpec('Property Service', 'PropertyService',
+             ((lambda: PropertyService(), ('search_properties', 'get_all_properties')),),
+             None, "Property Service integration verified"),
+    TestSpec('Tools Integration', 'tools',
+             ((lambda: CalendarTool(), ('create_calendar_event', 'get_fixed_slots_next_day')),
+              (lambda: SMSTool(), ('send_appointment_confirmation',))),
+             None, "Calendar and SMS tools integration verified"),
+)
+
+
+def _run_spec(spec: 'TestSpec') -> bool:
+    """Run one spec: skip on recorded import failure, instantiate each
+    target and verify its required attributes, then run any extra checks"""
+    print(f"🧪 Testing {spec.name}...")
+
+    err = _IMPORT_ERRORS.get(spec.key)
+    if err is not None:
+        print(f"❌ {spec.name} test failed: {err}")
+        return False
+
     try:
-        from src.tools.calendar_tool import CalendarTool
-        from src.tools.sms_tool import SMSTool
-        
-        # Test tools initialization
-        calendar_tool = CalendarTool()
-        sms_tool = SMSTool()
-        
-        # Verify key methods exist
-        assert hasattr(calendar_tool, 'create_calendar_event')
-        assert hasattr(calendar_tool, 'get_fixed_slots_next_day')
-        assert hasattr(sms_tool, 'send_appointment_confirmation')
-        
-        print("✅ Calendar and SMS tools integration verified")
+        for factory, attrs in spec.targets:
+            obj = factory()
+            missing = frozenset(attrs).difference(dir(obj))
+            assert not missing, f"Missing: {sorted(missing)}"
+        if spec.extra is not None:
+            spec.extra()
+
+        print(f"✅ {spec.success}")
         return True
-        
+
     except Exception as e:
-        print(f"❌ Tools integration test failed: {e}")
+        print(f"❌ {spec.name} test failed: {e}")
         return False
 
 
+class _ThreadLocalStdout:
+    """Stdout proxy routing each worker thread's prints to its own buffer,
+    so concurrent tests don't interleave their console output"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def set_buffer(self, buf):
+        self._local.buf = buf
+
+    def write(self, s):
+        target = getattr(self._local, 'buf', None) or self._fallback
+        return target.write(s)
+
+    def flush(self):
+        target = getattr(self._local, 'buf', None) or self._fallback
+        target.flush()
+
+
+# Status-row template pre-bound to its mod operator: one C-level format call
+# per row in the summary loop instead of the f-string opcode sequence
+_ROW = "%-20s %s".__mod__
+
+
 def main():
     """Run comprehensive verification"""
     print("🚀 Comprehensive LangGraph PropertyTek Verification")
     print("=" * 60)
-    
-    tests = [
-        ("WorkflowState", test_workflow_state),
-        ("OpenAI Service", test_openai_service),
-        ("Workflow Nodes", test_workflow_nodes),
-        ("LangGraph API", test_langgraph_api),
-        ("Property Service", test_property_service),
-        ("Tools Integration", test_tools_integration)
-    ]
-    
+
+    tests = [(spec.name, partial(_run_spec, spec)) for spec in _SPECS]
+
     results = {}
-    
-    for test_name, test_func in tests:
+
+    # The tests are independent and block on filesystem / client setup, so
+    # they run concurrently; each thread's prints go to a private buffer
+    # that is replayed in test order once all have finished
+    def run_buffered(test_name, test_func):
+        buf = io.StringIO()
+        proxy.set_buffer(buf)
         try:
-            results[test_name] = test_func()
+            ok = test_func()
         except Exception as e:
             print(f"❌ {test_name} test crashed: {e}")
-            results[test_name] = False
+            ok = False
         print()  # Add spacing between tests
+        return ok, buf.getvalue()
+
+    proxy = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+            futures = [(name, ex.submit(run_buffered, name, fn)) for name, fn in tests]
+            outcomes = [(name, fut.result()) for name, fut in futures]
+    finally:
+        sys.stdout = proxy._fallback
+
+    for test_name, (ok, output) in outcomes:
+        results[test_name] = ok
+        print(output, end="")
     
-    # Summary
-    print("=" * 60)
-    print("📊 Verification Results:")
-    print("-" * 30)
-    
-    passed = 0
+    # Summary: build the block as lines and emit one write instead of ~15
+    # separate print calls
+    lines = ["=" * 60, "📊 Verification Results:", "-" * 30]
+
+    # Booleans sum in C; no Python-level counter needed
+    passed = sum(results.values())
     total = len(tests)
-    
-    for test_name, result in results.items():
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{test_name:<20} {status}")
-        if result:
-            passed += 1
-    
-    print("-" * 30)
-    print(f"Total: {passed}/{total} tests passed")
-    
+
+    lines.extend(
+        _ROW((test_name, "✅ PASS" if result else "❌ FAIL"))
+        for test_name, result in results.items()
+    )
+
+    lines.append("-" * 30)
+    lines.append(f"Total: {passed}/{total} tests passed")
+
     if passed == total:
-        print("\n🎉 All verification tests passed!")
-        print("🚀 Your LangGraph PropertyTek implementation is ready!")
-        print("\n📝 Next steps:")
-        print("1. Install dependencies: python install_dependencies.py")
-        print("2. Configure .env with your API keys")
-        print("3. Run server: python run_server.py")
-        print("4. Test API: http://localhost:8000/docs")
+        lines.extend((
+            "\n🎉 All verification tests passed!",
+            "🚀 Your LangGraph PropertyTek implementation is ready!",
+            "\n📝 Next steps:",
+            "1. Install dependencies: python install_dependencies.py",
+            "2. Configure .env with your API keys",
+            "3. Run server: python run_server.py",
+            "4. Test API: http://localhost:8000/docs",
+        ))
     else:
-        print(f"\n⚠️  {total - passed} tests failed. Check the errors above.")
-        print("💡 Most failures are likely due to missing dependencies.")
-        print("   Run: python install_dependencies.py")
+        lines.extend((
+            f"\n⚠️  {total - passed} tests failed. Check the errors above.",
+            "💡 Most failures are likely due to missing dependencies.",
+            "   Run: python install_dependencies.py",
+        ))
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":